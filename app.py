@@ -10,9 +10,33 @@ from datetime import datetime
 # ---------------------------
 sys.path.append(str(Path(__file__).resolve().parent))
 
-from services.nba_player_logs import fetch_player_logs
+from services.nba_player_logs import (
+    DEFAULT_END_YEAR,
+    DEFAULT_YEARS_BACK,
+    fetch_player_logs_cached,
+    logs_cache_size,
+)
 from nba_api.stats.static import players
-from services.lineups import show_lineups_page
+from services.lineups import get_scoreboard_games, show_lineups_page
+from services.matchups import (
+    load_matchup_table,
+    load_position_map,
+    matchup_lookup,
+)
+from services.teammates import build_team_index, split_mask, teammate_options
+from services.engine import (
+    STAT_OPTIONS,
+    RECENT_OPTIONS,
+    REST_OPTIONS,
+    VENUE_OPTIONS,
+    apply_filters,
+    ensure_cols,
+    has_schedule_context,
+    evaluate_prop,
+)
+from services.prewarm import prewarm_status, start_prewarm
+from services.http_cache import install_http_cache
+from services.compare import MAX_PLAYERS, compare_players, fetch_many
 
 # ---------------------------
 # Page config
@@ -29,6 +53,16 @@ if "cache" not in st.session_state:
 if "parlay" not in st.session_state:
     st.session_state.parlay = []
 
+# ---------------------------
+# Shared HTTP cache + background slate prewarm (once per process)
+# ---------------------------
+@st.cache_resource(show_spinner=False)
+def start_scheduler():
+    install_http_cache()
+    return start_prewarm()
+
+start_scheduler()
+
 # ---------------------------
 # Constants & Team Data
 # ---------------------------
@@ -68,6 +102,28 @@ TEAM_COLORS = {
 def load_players():
     return sorted(p["full_name"] for p in players.get_active_players())
 
+@st.cache_data(ttl=600, show_spinner=False)
+def load_matchups():
+    # Tables are refreshed by the prewarm thread; the page only reads them
+    return matchup_lookup(load_matchup_table()), load_position_map()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_team_index(seasons: tuple):
+    try:
+        return build_team_index(seasons)
+    except Exception:
+        return {}
+
+def next_opponent(team: str):
+    """Tonight's opponent for a team from the live scoreboard (None if no game)."""
+    for g in get_scoreboard_games():
+        if g.get("gameStatus") not in (1, 2):
+            continue
+        away, home = g["awayTeam"]["teamTricode"], g["homeTeam"]["teamTricode"]
+        if team in (away, home):
+            return home if team == away else away
+    return None
+
 def headshot(pid: int) -> str:
     return f"https://cdn.nba.com/headshots/nba/latest/1040x760/{pid}.png"
 
@@ -75,43 +131,65 @@ def team_logo(abbr: str) -> str:
     tid = TEAM_ABBR_TO_ID.get(abbr)
     return f"https://cdn.nba.com/logos/nba/{tid}/primary/L/logo.svg" if tid else ""
 
-def american_to_decimal(o: float) -> float:
-    return (o / 100.0 + 1.0) if o > 0 else (100.0 / abs(o) + 1.0)
-
-def decimal_to_american(d: float) -> str:
-    if d <= 1: return "N/A"
-    return f"+{int((d - 1) * 100)}" if d >= 2 else f"-{int(100 / (d - 1))}"
-
-def ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    numeric_cols = ["PTS", "REB", "AST", "FG3M", "MIN"]
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], errors="coerce")
-    df = df.dropna(subset=["GAME_DATE"])
-    if "TEAM_ABBR" not in df.columns:
-        df["TEAM_ABBR"] = df["MATCHUP"].astype(str).str[:3]
-    if "OPP_ABBR" not in df.columns:
-        df["OPP_ABBR"] = df["MATCHUP"].astype(str).str[-3:]
-    df["Pts+Reb+Ast"] = df["PTS"] + df["REB"] + df["AST"]
-    df["Pts+Reb"] = df["PTS"] + df["REB"]
-    df["Pts+Ast"] = df["PTS"] + df["AST"]
-    df["Reb+Ast"] = df["REB"] + df["AST"]
-    return df.sort_values("GAME_DATE", ascending=False)
-
 # ---------------------------
 # Navigation Routing
 # ---------------------------
 with st.sidebar:
     st.title("Navigation")
-    page = st.radio("Go to", ["Prop Analysis", "Lineups & Injuries"])
+    page = st.radio("Go to", ["Prop Analysis", "Player Comparison", "Lineups & Injuries", "Admin"])
     st.divider()
 
 if page == "Lineups & Injuries":
     show_lineups_page(TEAM_ABBR_TO_ID)
     st.stop()
 
+if page == "Player Comparison":
+    st.title("⚖️ Player Comparison")
+    picks = st.multiselect("Players", load_players(), max_selections=MAX_PLAYERS)
+    k1, k2, k3, k4 = st.columns(4)
+    with k1: cmp_stat = st.selectbox("Stat", STAT_OPTIONS, key="cmp_stat")
+    with k2: cmp_line = st.selectbox("Line", [x * 0.5 for x in range(0, 121)], index=40, key="cmp_line")
+    with k3: cmp_side = st.selectbox("Side", ["Over", "Under"], key="cmp_side")
+    with k4: cmp_window = st.selectbox("Window", [10, 20, 40, 82], index=1, key="cmp_window")
+
+    if st.button("Compare") and picks:
+        with st.spinner(f"Fetching {len(picks)} players..."):
+            st.session_state.compare = fetch_many(picks)
+
+    loaded = st.session_state.get("compare") or {}
+    ok = {n: df for n, df in loaded.items() if isinstance(df, pd.DataFrame) and not df.empty}
+    for n, df in loaded.items():
+        if n in ok: continue
+        reason = f"couldn't load game logs ({df})" if isinstance(df, Exception) else "no game logs found"
+        st.warning(f"{n}: {reason}")
+    if not ok:
+        st.info("Pick up to 10 players and press Compare.")
+        st.stop()
+
+    table = compare_players(ok, cmp_stat, cmp_line, cmp_side, cmp_window)
+    st.dataframe(table, hide_index=True, use_container_width=True)
+    st.stop()
+
+if page == "Admin":
+    st.title("⚙️ Admin")
+    st.subheader("Slate Prewarm")
+    status = prewarm_status()
+    total = max(status["total"], 1)
+    st.progress(min(status["done"] / total, 1.0), text=f"{status['state'].title()} • {status['done']}/{status['total']} cached")
+    s1, s2, s3 = st.columns(3)
+    s1.metric("Games", len(status["games"]))
+    s2.metric("Failed", len(status["failed"]))
+    s3.metric("Cached player logs", logs_cache_size())
+    if status["current"]: st.caption(f"Fetching: {status['current']}")
+    if status["started_at"]: st.caption(f"Last run started {status['started_at'].strftime('%I:%M:%S %p')}")
+    if status["games"]: st.write(" • ".join(status["games"]))
+    if status["last_error"]: st.warning(status["last_error"])
+    if status["failed"]:
+        with st.expander("Failures"):
+            st.write(status["failed"])
+    if st.button("Refresh"): st.rerun()
+    st.stop()
+
 # ---------------------------
 # PROP ANALYSIS PAGE
 # ---------------------------
@@ -119,8 +197,8 @@ st.title("🏀 NBA Player Game Log & Prop Analysis")
 player = st.selectbox("Search active player", load_players(), index=None)
 
 if st.button("Fetch Game Logs") and player:
-    if player not in st.session_state.cache:
-        st.session_state.cache[player] = fetch_player_logs(player)
+    # Always read through the process-wide TTL cache so new games show up
+    st.session_state.cache[player] = fetch_player_logs_cached(player, DEFAULT_END_YEAR, DEFAULT_YEARS_BACK)
     st.session_state.logs = ensure_cols(st.session_state.cache[player])
 
 if st.session_state.logs is None:
@@ -148,16 +226,29 @@ st.markdown(
 
 # Filters
 st.subheader("Filters")
-f1, f2, f3 = st.columns(3)
+f1, f2, f3, f4, f5 = st.columns(5)
 with f1: season_filter = st.selectbox("Season", ["All"] + sorted(logs["SEASON_USED"].unique()))
 with f2: opp_filter = st.selectbox("Opponent", ["All"] + sorted(logs["OPP_ABBR"].unique()))
-with f3: recent_filter = st.selectbox("Recent Games", ["All", "Last 5", "Last 10"])
+with f3: recent_filter = st.selectbox("Recent Games", list(RECENT_OPTIONS))
+has_ctx = has_schedule_context(logs)
+with f4: rest_filter = st.selectbox("Rest", REST_OPTIONS, disabled=not has_ctx)
+with f5: venue_filter = st.selectbox("Venue", VENUE_OPTIONS, disabled=not has_ctx)
+if not has_ctx:
+    rest_filter = venue_filter = "All"
+    st.caption("Rest / venue filters unavailable: schedule context could not be loaded.")
+
+# With / without teammate split (per-team GAME_ID index)
+team_entry = load_team_index(tuple(sorted(logs["SEASON_USED"].unique()))).get(team_abbr, {})
+mates = teammate_options(team_entry, exclude_id=pid)
+t1, t2 = st.columns([3, 1])
+with t1: teammate_filter = st.multiselect("Teammates", list(mates), format_func=lambda x: mates.get(x, str(x)))
+with t2: teammate_mode = st.radio("Split", ["With", "Without"], horizontal=True)
 
-flt = logs.copy()
-if season_filter != "All": flt = flt[flt["SEASON_USED"] == season_filter]
-if opp_filter != "All": flt = flt[flt["OPP_ABBR"] == opp_filter]
-if recent_filter == "Last 5": flt = flt.head(5)
-elif recent_filter == "Last 10": flt = flt.head(10)
+teammate_mask = split_mask(logs["Game_ID"], team_entry, teammate_filter, teammate_mode) if teammate_filter else None
+flt = apply_filters(
+    logs, season_filter, opp_filter, recent_filter,
+    mask=teammate_mask, rest=rest_filter, venue=venue_filter,
+).copy()
 
 # --- SEASON AVERAGES (RESTORED) ---
 st.subheader("Averages")
@@ -168,9 +259,28 @@ b.metric("REB", f"{avg['REB']:.1f}")
 c.metric("AST", f"{avg['AST']:.1f}")
 d.metric("3PM", f"{avg['FG3M']:.1f}")
 
+# --- MATCHUP CONTEXT (league-wide, materialized) ---
+st.subheader("Matchup Context")
+matchups, positions = load_matchups()
+position = positions.get(pid)
+matchup_opp, opp_source = next_opponent(team_abbr), "tonight"
+if matchup_opp is None:
+    matchup_opp, opp_source = (
+        (opp_filter, "filter") if opp_filter != "All" else (str(logs["OPP_ABBR"].iloc[0]), "last game")
+    )
+ctx = matchups.get((matchup_opp, position))
+if ctx:
+    st.caption(f"Allowed by {matchup_opp} ({opp_source}) to {position}s • last {int(ctx['GAMES'])} games • rank 1 = most allowed")
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("PTS allowed", f"{ctx['PTS']:.1f}", f"#{int(ctx['PTS_RANK'])}", delta_color="off")
+    m2.metric("REB allowed", f"{ctx['REB']:.1f}", f"#{int(ctx['REB_RANK'])}", delta_color="off")
+    m3.metric("AST allowed", f"{ctx['AST']:.1f}", f"#{int(ctx['AST_RANK'])}", delta_color="off")
+    m4.metric("3PM allowed", f"{ctx['FG3M']:.1f}", f"#{int(ctx['FG3M_RANK'])}", delta_color="off")
+else:
+    st.caption(f"No matchup data for {matchup_opp} yet.")
+
 # Prop Evaluation Inputs
 st.subheader("Prop Evaluation")
-STAT_OPTIONS = ["PTS", "REB", "AST", "FG3M", "Pts+Reb+Ast", "Pts+Reb", "Pts+Ast", "Reb+Ast"]
 p1, p2, p3, p4, p5 = st.columns(5)
 with p1: selected_stat = st.selectbox("Stat", STAT_OPTIONS, key="prop_stat")
 with p2: prop_line = st.selectbox("Line", [x * 0.5 for x in range(0, 121)], key="prop_line")
@@ -179,17 +289,19 @@ with p4: odds_type = st.selectbox("Odds Type", ["American", "Decimal"], key="pro
 with p5: odds = st.number_input("Odds", value=-110.0 if odds_type == "American" else 1.91, key="prop_odds")
 
 # Hit Rate / Edge
+recency = st.toggle("Recency-weighted probability", value=False, key="prop_recency")
 if prop_line > 0 and not flt.empty:
-    flt["HIT"] = flt[selected_stat] > float(prop_line) if side == "Over" else flt[selected_stat] < float(prop_line)
-    hits = int(flt["HIT"].sum())
-    rate = (hits / len(flt) * 100)
-    dec = american_to_decimal(float(odds)) if odds_type == "American" else float(odds)
-    edge = rate - (1/dec * 100)
+    ev = evaluate_prop(flt, logs, selected_stat, prop_line, side, odds, odds_type, recency)
+    edge = ev["edge"]
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Games", len(flt))
-    c2.metric("Hits", hits)
-    c3.metric("Hit Rate", f"{rate:.1f}%")
-    c4.markdown(f'<div style="background:{"#16a34a" if edge > 0 else "#dc2626"};padding:12px;border-radius:10px;text-align:center;color:white;font-weight:800;">{edge:+.1f}% Edge</div>', unsafe_allow_html=True)
+    c1.metric("Games", ev["games"])
+    c2.metric("Hits", ev["hits"])
+    c3.metric("Hit Rate", f"{ev['hit_rate']:.1f}%")
+    c4.markdown(f'<div style="background:{"#16a34a" if edge > 0 else "#dc2626"};padding:12px;border-radius:10px;text-align:center;color:white;font-weight:800;">{edge:+.1f}% Edge<div style="font-size:11px;font-weight:600;opacity:.9;">{ev["edge_lo"]:+.1f}% to {ev["edge_hi"]:+.1f}%</div></div>', unsafe_allow_html=True)
+    st.caption(
+        f"Model probability {ev['prob']:.1f}% (90% interval {ev['prob_lo']:.1f}–{ev['prob_hi']:.1f}%) • "
+        f"bootstrap {ev['boot_lo']:.1f}–{ev['boot_hi']:.1f}% • implied {ev['implied']:.1f}%"
+    )
 
 is_mobile = st.checkbox("📱 Mobile view", value=False)
 
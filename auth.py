@@ -1,9 +1,13 @@
 import streamlit as st
+import streamlit.components.v1 as components
+import hashlib
+import hmac
 import json
 import os
+import secrets
+from functools import lru_cache
 
-from itsdangerous import URLSafeTimedSerializer, BadSignature
-from streamlit_cookies_manager import EncryptedCookieManager
+from services.sessions import SESSION_MAX_AGE, SessionStore
 
 
 # ---------------------------
@@ -24,61 +28,108 @@ SECRETS = load_secrets()
 # ---------------------------
 # Config
 # ---------------------------
-AUTH_SECRET = SECRETS.get("auth", {}).get("secret_key", "dev-secret-key")
-COOKIE_NAME = "nba_app_auth"
-COOKIE_MAX_AGE = 60 * 60 * 24 * 7  # 7 days
+COOKIE_NAME = "nba_app_sid"
+HASH_SCHEME = "pbkdf2_sha256"
+HASH_ITERATIONS = 260_000
 
 
 # ---------------------------
-# Cookie + token setup
+# Session store (one per process, shared DB across processes)
 # ---------------------------
-serializer = URLSafeTimedSerializer(AUTH_SECRET)
+@st.cache_resource(show_spinner=False)
+def get_session_store() -> SessionStore:
+    store = SessionStore()
+    store.prune()
+    return store
 
-cookies = EncryptedCookieManager(
-    prefix="nba_app_",
-    password=AUTH_SECRET
-)
 
-# Required by streamlit-cookies-manager
-if not cookies.ready():
-    st.stop()
+# ---------------------------
+# Password hashing
+# ---------------------------
+def hash_password(password: str, iterations: int = HASH_ITERATIONS) -> str:
+    """Value to put in secrets [auth.users]: 'pbkdf2_sha256$<iters>$<salt>$<hash>'."""
+    salt = secrets.token_hex(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), iterations)
+    return f"{HASH_SCHEME}${iterations}${salt}${digest.hex()}"
+
+
+def verify_password(stored: str, password: str) -> bool:
+    try:
+        scheme, iterations, salt, expected = stored.split("$")
+    except ValueError:
+        return False
+    if scheme != HASH_SCHEME:
+        return False
+    try:
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), int(iterations))
+    except ValueError:
+        return False  # malformed salt / iteration count in secrets
+    return hmac.compare_digest(digest.hex(), expected)
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    return hash_password(secrets.token_hex(16))
+
+
+def check_credentials(users: dict, username: str, password: str) -> bool:
+    # Unknown users still pay for one PBKDF2 run, so timing doesn't reveal
+    # which usernames exist
+    stored = users.get(username)
+    ok = verify_password(stored or _dummy_hash(), password)
+    return ok and stored is not None
 
 
 # ---------------------------
-# Helpers
+# Cookie helpers
+# The cookie is read from the websocket request headers (st.context),
+# so restoring a session needs no component handshake or extra rerun.
+# It's written from JS, so it can't be HttpOnly; Secure keeps it off
+# plain-HTTP requests (browsers still allow it on localhost).
 # ---------------------------
-def set_login_cookie(username: str):
-    token = serializer.dumps(username)
-    cookies[COOKIE_NAME] = token
-    cookies.save()
+def _write_cookie(value: str, max_age: int):
+    components.html(
+        f"<script>parent.document.cookie = "
+        f"'{COOKIE_NAME}={value}; max-age={max_age}; path=/; SameSite=Strict; Secure';</script>",
+        height=0,
+    )
+
+
+def set_login_cookie(username: str) -> str:
+    sid = get_session_store().create(username)
+    _write_cookie(sid, SESSION_MAX_AGE)
+    return sid
 
 
 def clear_login_cookie():
-    if COOKIE_NAME in cookies:
-        del cookies[COOKIE_NAME]
-        cookies.save()
+    # Deleting server-side is what ends the session; the cookie is just tidied
+    sid = st.session_state.get("sid")
+    if sid:
+        get_session_store().delete(sid)
+    _write_cookie("", 0)
 
 
 def get_logged_in_user():
-    token = cookies.get(COOKIE_NAME)
-    if not token:
-        return None
-
-    try:
-        return serializer.loads(token, max_age=COOKIE_MAX_AGE)
-    except BadSignature:
-        return None
+    sid = st.context.cookies.get(COOKIE_NAME)
+    if not sid:
+        return None, None
+    return get_session_store().get(sid), sid
 
 
 # ---------------------------
 # Main auth gate
 # ---------------------------
 def require_login():
-    # Restore session from cookie
-    user = get_logged_in_user()
+    # Identity verified once per browser session, then served from memory
+    if st.session_state.get("authenticated"):
+        return True
+
+    # Restore session from cookie (one indexed lookup, no crypto)
+    user, sid = get_logged_in_user()
     if user:
         st.session_state.authenticated = True
         st.session_state.user = user
+        st.session_state.sid = sid
         return True
 
     st.session_state.authenticated = False
@@ -89,17 +140,21 @@ def require_login():
         st.error("Authentication is not configured.")
         return False
 
-    st.title("🔐 Login")
+    form = st.empty()
+    with form.container():
+        st.title("🔐 Login")
 
-    username = st.text_input("Username")
-    password = st.text_input("Password", type="password")
+        username = st.text_input("Username")
+        password = st.text_input("Password", type="password")
+        clicked = st.button("Login")
 
-    if st.button("Login"):
-        if username in users and password == users[username]:
+    if clicked:
+        if check_credentials(users, username, password):
+            form.empty()  # carry on rendering the app in this same run
             st.session_state.authenticated = True
             st.session_state.user = username
-            set_login_cookie(username)
-            st.rerun()
+            st.session_state.sid = set_login_cookie(username)
+            return True
         else:
             st.error("Invalid username or password")
 
@@ -113,4 +168,5 @@ def logout():
     clear_login_cookie()
     st.session_state.authenticated = False
     st.session_state.user = None
-    st.rerun()
\ No newline at end of file
+    st.session_state.sid = None
+    st.rerun()
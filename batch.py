@@ -0,0 +1,260 @@
+"""
+Headless batch evaluation of player props (no Streamlit).
+
+    python batch.py run requests.json [--out results.json] [--format json|arrow]
+    python batch.py serve [--host 127.0.0.1] [--port 8765]
+
+Input is a JSON list (or JSON lines) of requests:
+    {"player": "Nikola Jokic", "stat": "PTS", "line": 24.5, "side": "Over",
+     "odds": -110, "odds_type": "American", "season": "All",
+     "opponent": "All", "recent": "Last 10", "rest": "All",
+     "venue": "All", "recency": false}
+Only "player", "stat" and "line" are required.
+"""
+import argparse
+import json
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# ---------------------------
+# Ensure project root on path
+# ---------------------------
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from services.engine import STAT_OPTIONS, apply_filters, ensure_cols, evaluate_props, project
+from services.http_cache import install_http_cache
+from services.nba_player_logs import (
+    DEFAULT_END_YEAR,
+    DEFAULT_YEARS_BACK,
+    fetch_player_logs_cached,
+)
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+DEFAULTS = {
+    "side": "Over",
+    "odds": -110.0,
+    "odds_type": "American",
+    "season": "All",
+    "opponent": "All",
+    "recent": "All",
+    "rest": "All",
+    "venue": "All",
+    "recency": False,
+}
+
+REQUIRED = ("player", "stat", "line")
+
+# Requests sharing these (plus the player) share one filtered sample
+GROUP_KEYS = ("season", "opponent", "recent", "rest", "venue", "side", "recency")
+
+MAX_WORKERS = 4
+
+
+# ---------------------------
+# Core
+# ---------------------------
+def _load_logs(player: str):
+    return ensure_cols(fetch_player_logs_cached(player, DEFAULT_END_YEAR, DEFAULT_YEARS_BACK))
+
+
+def validate_request(req) -> str:
+    """Error message for a malformed request, or None if it can be evaluated."""
+    if not isinstance(req, dict):
+        return "request must be a JSON object"
+    missing = [k for k in REQUIRED if req.get(k) in (None, "")]
+    if missing:
+        return f"missing required field(s): {', '.join(missing)}"
+    if req["stat"] not in STAT_OPTIONS:
+        return f"unknown stat {req['stat']!r} (expected one of {', '.join(STAT_OPTIONS)})"
+    for field in ("line", "odds"):
+        try:
+            float(req.get(field, DEFAULTS.get(field, 0)))
+        except (TypeError, ValueError):
+            return f"{field} must be a number, got {req[field]!r}"
+    return None
+
+
+def _evaluate_group(reqs: list, logs) -> list:
+    """
+    Requests for one player with identical filters: filter once, then
+    score every stat/line in a single vectorised hit_probability call.
+    """
+    reqs = [{**DEFAULTS, **r} for r in reqs]
+    first = reqs[0]
+    flt = apply_filters(
+        logs, first["season"], first["opponent"], first["recent"],
+        rest=first["rest"], venue=first["venue"],
+    )
+    evs = evaluate_props(
+        flt, logs,
+        [(r["stat"], float(r["line"]), float(r["odds"]), r["odds_type"]) for r in reqs],
+        first["side"], bool(first["recency"]),
+    )
+    return [{**r, **ev, "projection": project(flt, r["stat"])} for r, ev in zip(reqs, evs)]
+
+
+def evaluate_batch(requests: list, max_workers: int = MAX_WORKERS) -> list:
+    """
+    Fetch each distinct player once (in parallel), then evaluate each
+    (player, filters) group in one vectorised pass, groups also in
+    parallel. Output order matches input order; malformed requests get a
+    per-item "error" instead of failing the batch.
+    """
+    results = [None] * len(requests)
+    groups = {}
+    for i, req in enumerate(requests):
+        bad = validate_request(req)
+        if bad:
+            results[i] = {**req, "error": bad} if isinstance(req, dict) else {"request": req, "error": bad}
+            continue
+        full = {**DEFAULTS, **req}
+        key = (req["player"],) + tuple(str(full[k]) for k in GROUP_KEYS)
+        groups.setdefault(key, []).append(i)
+
+    players = list(dict.fromkeys(key[0] for key in groups))
+
+    def load(player):
+        try:
+            return player, _load_logs(player), None
+        except Exception as e:
+            return player, None, str(e)
+
+    def run(item):
+        key, idx = item
+        logs, err = loaded[key[0]]
+        reqs = [requests[i] for i in idx]
+        if err:
+            return idx, [{**r, "error": err} for r in reqs]
+        try:
+            return idx, _evaluate_group(reqs, logs)
+        except Exception as e:
+            return idx, [{**r, "error": str(e)} for r in reqs]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        loaded = {p: (logs, err) for p, logs, err in pool.map(load, players)}
+        for idx, out in pool.map(run, groups.items()):
+            for i, res in zip(idx, out):
+                results[i] = res
+    return results
+
+
+# ---------------------------
+# Output
+# ---------------------------
+def _clean(value):
+    """NaN / inf -> None so the output is valid JSON (and null in Arrow)."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _clean(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clean(v) for v in value]
+    return value
+
+
+def to_json(results: list, indent: int = None) -> str:
+    return json.dumps(_clean(results), indent=indent, default=str, allow_nan=False)
+
+
+def to_arrow_bytes(results: list) -> bytes:
+    if pa is None:
+        raise RuntimeError("Arrow output needs pyarrow (pip install pyarrow).")
+    table = pa.Table.from_pylist(_clean(results))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def read_requests(text: str) -> list:
+    text = text.strip()
+    if text.startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+# ---------------------------
+# Local HTTP service
+# ---------------------------
+class BatchHandler(BaseHTTPRequestHandler):
+    """POST /evaluate with a JSON list; ?format=arrow for an Arrow IPC stream."""
+
+    def _send(self, code: int, body: bytes, content_type: str):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if not self.path.startswith("/evaluate"):
+            self._send(404, b'{"error": "not found"}', "application/json")
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            results = evaluate_batch(read_requests(self.rfile.read(length).decode()))
+            if "format=arrow" in self.path:
+                self._send(200, to_arrow_bytes(results), "application/vnd.apache.arrow.stream")
+            else:
+                self._send(200, to_json(results).encode(), "application/json")
+        except Exception as e:
+            self._send(400, json.dumps({"error": str(e)}).encode(), "application/json")
+
+
+def serve(host: str, port: int):
+    server = ThreadingHTTPServer((host, port), BatchHandler)
+    print(f"Serving batch evaluations on http://{host}:{port}/evaluate")
+    server.serve_forever()
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless prop evaluation")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    run = sub.add_parser("run", help="evaluate a batch file ('-' for stdin)")
+    run.add_argument("input")
+    run.add_argument("--out", default="-")
+    run.add_argument("--format", choices=["json", "arrow"], default="json")
+    run.add_argument("--workers", type=int, default=MAX_WORKERS)
+
+    srv = sub.add_parser("serve", help="run the local HTTP service")
+    srv.add_argument("--host", default="127.0.0.1")
+    srv.add_argument("--port", type=int, default=8765)
+
+    args = parser.parse_args(argv)
+    install_http_cache()
+
+    if args.cmd == "serve":
+        serve(args.host, args.port)
+        return
+
+    text = sys.stdin.read() if args.input == "-" else Path(args.input).read_text()
+    results = evaluate_batch(read_requests(text), args.workers)
+
+    if args.format == "arrow":
+        body = to_arrow_bytes(results)
+        if args.out == "-":
+            sys.stdout.buffer.write(body)
+        else:
+            Path(args.out).write_bytes(body)
+    else:
+        body = to_json(results, indent=2)
+        if args.out == "-":
+            print(body)
+        else:
+            Path(args.out).write_text(body)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,30 +16,40 @@ MODEL_DIR.mkdir(exist_ok=True)
 
 TARGETS = ["PTS", "REB", "AST", "FG3M"]
 
-FEATURES = [
+ROLLING_FEATURES = [
     "MIN_L5", "MIN_L10",
     "PTS_L5", "REB_L5", "AST_L5", "FG3M_L5",
     "PTS_L10", "REB_L10", "AST_L10", "FG3M_L10",
 ]
 
+SCHEDULE_FEATURES = ["REST_DAYS", "IS_B2B", "GAMES_LAST_7", "IS_HOME"]
+
+FEATURES = ROLLING_FEATURES + SCHEDULE_FEATURES
+
 # -------------------------
 # Load training data
 # -------------------------
 def load_training_data(player_name: str):
+    """Returns (df, features); schedule features are dropped if context is missing."""
     df = fetch_player_logs(player_name)
     df = add_rolling_features(df)
 
-    df = df.dropna(subset=FEATURES + TARGETS)
-    return df
+    features = FEATURES
+    if not all(col in df.columns for col in SCHEDULE_FEATURES):
+        print("⚠️ Schedule context unavailable; training on rolling features only")
+        features = ROLLING_FEATURES
+
+    df = df.dropna(subset=features + TARGETS)
+    return df, features
 
 
 # -------------------------
 # Train models
 # -------------------------
 def train_models(player_name: str):
-    df = load_training_data(player_name)
+    df, features = load_training_data(player_name)
 
-    X = df[FEATURES]
+    X = df[features]
 
     models = {}
 
@@ -60,7 +70,7 @@ def train_models(player_name: str):
         )
 
     print(f"✅ Models trained for {player_name}")
-    print("Features used:", FEATURES)
+    print("Features used:", features)
 
 
 if __name__ == "__main__":
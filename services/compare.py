@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .engine import STAT_OPTIONS, ensure_cols
+from .nba_player_logs import (
+    DEFAULT_END_YEAR,
+    DEFAULT_YEARS_BACK,
+    fetch_player_logs_cached,
+)
+
+
+# ---------------------------
+# Config
+# ---------------------------
+MAX_PLAYERS = 10
+MAX_WORKERS = 4
+
+
+# ---------------------------
+# Parallel fetch
+# ---------------------------
+def fetch_many(names, max_workers: int = MAX_WORKERS) -> dict:
+    """name -> cleaned logs (or the exception raised for that player)."""
+    def load(name):
+        try:
+            return name, ensure_cols(
+                fetch_player_logs_cached(name, DEFAULT_END_YEAR, DEFAULT_YEARS_BACK)
+            )
+        except Exception as e:
+            return name, e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(pool.map(load, names))
+
+
+# ---------------------------
+# Aligned stat matrix
+# ---------------------------
+def stack_logs(logs_list, stats=STAT_OPTIONS, window: int = 20) -> np.ndarray:
+    """
+    (players × games × stats) array of each player's last `window` games,
+    newest first. Players with fewer games are padded with NaN.
+    """
+    arr = np.full((len(logs_list), window, len(stats)), np.nan)
+    for i, logs in enumerate(logs_list):
+        recent = logs[stats].head(window).to_numpy(dtype=float)
+        arr[i, : len(recent)] = recent
+    return arr
+
+
+def compare_players(
+    logs_by_name: dict,
+    stat: str,
+    line: float,
+    side: str = "Over",
+    window: int = 20,
+    stats=STAT_OPTIONS,
+) -> pd.DataFrame:
+    """Side-by-side table; every column comes from one vectorized op over the stack."""
+    names = list(logs_by_name)
+    arr = stack_logs([logs_by_name[n] for n in names], stats, window)
+    s = list(stats).index(stat)
+
+    games = np.sum(~np.isnan(arr[:, :, s]), axis=1)
+    avg = np.nanmean(arr, axis=1)                 # (P, S)
+    l5 = np.nanmean(arr[:, :5, s], axis=1)
+    l10 = np.nanmean(arr[:, :10, s], axis=1)
+
+    values = arr[:, :, s]
+    hit = values > line if side == "Over" else values < line
+    hit_rate = np.where(games > 0, hit.sum(axis=1) / np.maximum(games, 1) * 100, np.nan)
+
+    table = pd.DataFrame(avg, columns=list(stats)).round(1)
+    table.insert(0, "Player", names)
+    table.insert(1, "Games", games)
+    table[f"{stat} L5"] = l5.round(1)
+    table[f"{stat} L10"] = l10.round(1)
+    table[f"{stat} Trend"] = (l5 - avg[:, s]).round(1)
+    table[f"Hit % ({side} {line})"] = hit_rate.round(1)
+    return table
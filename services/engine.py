@@ -0,0 +1,192 @@
+import numpy as np
+import pandas as pd
+
+from .probability import hit_probability
+
+
+# ---------------------------
+# Config
+# ---------------------------
+STAT_OPTIONS = ["PTS", "REB", "AST", "FG3M", "Pts+Reb+Ast", "Pts+Reb", "Pts+Ast", "Reb+Ast"]
+RECENT_OPTIONS = {"All": None, "Last 5": 5, "Last 10": 10}
+REST_OPTIONS = ["All", "Back-to-back", "1 day", "2+ days"]
+VENUE_OPTIONS = ["All", "Home", "Away"]
+
+RECENCY_HALF_LIFE = 5
+
+# Projection blend: recent form weighted over the longer sample
+PROJECTION_WEIGHTS = {"L5": 0.5, "L10": 0.3, "ALL": 0.2}
+
+
+# ---------------------------
+# Odds helpers
+# ---------------------------
+def american_to_decimal(o: float) -> float:
+    return (o / 100.0 + 1.0) if o > 0 else (100.0 / abs(o) + 1.0)
+
+
+def decimal_to_american(d: float) -> str:
+    if d <= 1: return "N/A"
+    return f"+{int((d - 1) * 100)}" if d >= 2 else f"-{int(100 / (d - 1))}"
+
+
+def to_decimal(odds: float, odds_type: str = "American") -> float:
+    return american_to_decimal(float(odds)) if odds_type == "American" else float(odds)
+
+
+# ---------------------------
+# Log preparation & filters
+# ---------------------------
+def ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    numeric_cols = ["PTS", "REB", "AST", "FG3M", "MIN"]
+    for col in numeric_cols:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], errors="coerce")
+    df = df.dropna(subset=["GAME_DATE"])
+    if "TEAM_ABBR" not in df.columns:
+        df["TEAM_ABBR"] = df["MATCHUP"].astype(str).str[:3]
+    if "OPP_ABBR" not in df.columns:
+        df["OPP_ABBR"] = df["MATCHUP"].astype(str).str[-3:]
+    df["Pts+Reb+Ast"] = df["PTS"] + df["REB"] + df["AST"]
+    df["Pts+Reb"] = df["PTS"] + df["REB"]
+    df["Pts+Ast"] = df["PTS"] + df["AST"]
+    df["Reb+Ast"] = df["REB"] + df["AST"]
+    return df.sort_values("GAME_DATE", ascending=False).reset_index(drop=True)
+
+
+def has_schedule_context(logs: pd.DataFrame) -> bool:
+    return (
+        "REST_DAYS" in logs.columns and "IS_HOME" in logs.columns
+        and logs["REST_DAYS"].notna().any()
+    )
+
+
+def apply_filters(
+    logs: pd.DataFrame,
+    season: str = "All",
+    opponent: str = "All",
+    recent: str = "All",
+    mask=None,
+    rest: str = "All",
+    venue: str = "All",
+) -> pd.DataFrame:
+    """
+    Same filter order as the Prop Analysis page.
+    mask: optional boolean array over logs rows (e.g. a teammate split),
+    applied before the recent-games cut.
+    Raises ValueError if a rest/venue filter is requested but the logs
+    carry no schedule context.
+    """
+    if (rest != "All" or venue != "All") and not has_schedule_context(logs):
+        raise ValueError("Rest/venue filters need schedule context, which is unavailable for these logs.")
+
+    keep = np.ones(len(logs), dtype=bool)
+    if season != "All": keep &= (logs["SEASON_USED"] == season).to_numpy()
+    if opponent != "All": keep &= (logs["OPP_ABBR"] == opponent).to_numpy()
+    if mask is not None: keep &= np.asarray(mask, dtype=bool)
+    if rest != "All":
+        r = logs["REST_DAYS"].to_numpy()
+        keep &= (r == 0) if rest == "Back-to-back" else (r == 1) if rest == "1 day" else (r >= 2)
+    if venue != "All":
+        keep &= (logs["IS_HOME"] == (1 if venue == "Home" else 0)).to_numpy()
+
+    flt = logs[keep]
+    n = RECENT_OPTIONS.get(recent)
+    return flt.head(n) if n else flt
+
+
+# ---------------------------
+# Evaluation
+# ---------------------------
+def hit_flags(values, line, side: str = "Over"):
+    """line may be a scalar or one line per column of a 2-D values array."""
+    line = np.asarray(line, dtype=float)
+    return values > line if side == "Over" else values < line
+
+
+def evaluate_props(
+    flt: pd.DataFrame,
+    logs: pd.DataFrame,
+    props: list,
+    side: str = "Over",
+    recency: bool = False,
+) -> list:
+    """
+    Vectorised evaluate_prop for many (stat, line, odds, odds_type) props
+    on the same filtered sample: one hit_probability call over an (n, R)
+    value matrix, one column per prop. Returns one dict per prop.
+    """
+    games = len(flt)
+    implied = [1 / to_decimal(odds, odds_type) * 100 for _, _, odds, odds_type in props]
+    if games == 0:
+        return [{"games": 0, "hits": 0, "implied": imp} for imp in implied]
+
+    stats = [stat for stat, _, _, _ in props]
+    lines = np.array([float(line) for _, line, _, _ in props])
+    values = flt[stats].to_numpy(dtype=float)
+
+    # Prior from games outside the sample, so the data isn't counted twice
+    outside = logs[~logs.index.isin(flt.index)][stats].to_numpy(dtype=float)
+    prior = hit_flags(outside, lines, side).mean(axis=0) if len(outside) else None
+
+    hits = hit_flags(values, lines, side).sum(axis=0)
+    prob = hit_probability(
+        values, lines.reshape(-1, 1), side,
+        half_life=RECENCY_HALF_LIFE if recency else None,
+        prior_rate=prior,
+    )
+    p_mid, p_lo, p_hi, b_lo, b_hi = (
+        prob[k][:, 0] * 100 for k in ("shrunk", "bayes_lo", "bayes_hi", "boot_lo", "boot_hi")
+    )
+
+    return [
+        {
+            "games": games,
+            "hits": int(hits[i]),
+            "hit_rate": hits[i] / games * 100,
+            "implied": implied[i],
+            "prob": float(p_mid[i]),
+            "prob_lo": float(p_lo[i]),
+            "prob_hi": float(p_hi[i]),
+            "boot_lo": float(b_lo[i]),
+            "boot_hi": float(b_hi[i]),
+            "edge": float(p_mid[i]) - implied[i],
+            "edge_lo": float(p_lo[i]) - implied[i],
+            "edge_hi": float(p_hi[i]) - implied[i],
+        }
+        for i in range(len(props))
+    ]
+
+
+def evaluate_prop(
+    flt: pd.DataFrame,
+    logs: pd.DataFrame,
+    stat: str,
+    line: float,
+    side: str = "Over",
+    odds: float = -110.0,
+    odds_type: str = "American",
+    recency: bool = False,
+) -> dict:
+    """
+    Hit rate, shrunk probability and edge for one prop.
+    The filtered sample is shrunk toward the player's rate in the games the
+    filters left out (flt must be a row subset of logs); with no games left
+    out (e.g. all-"All" filters) the prior is an uninformative 0.5.
+    Percentages are on a 0-100 scale.
+    """
+    return evaluate_props(flt, logs, [(stat, line, odds, odds_type)], side, recency)[0]
+
+
+def project(flt: pd.DataFrame, stat: str) -> float:
+    """Blend of last-5, last-10 and full-sample averages (newest-first logs)."""
+    if flt.empty:
+        return float("nan")
+    parts = {
+        "L5": flt[stat].head(5).mean(),
+        "L10": flt[stat].head(10).mean(),
+        "ALL": flt[stat].mean(),
+    }
+    return float(sum(PROJECTION_WEIGHTS[k] * v for k, v in parts.items()))
@@ -0,0 +1,259 @@
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+import requests
+
+from .storage import current_season, data_path
+
+
+# ---------------------------
+# Config
+# ---------------------------
+DB_FILE = "http_cache.sqlite3"
+
+LEASE_SECONDS = 30      # how long one worker may hold a fetch before others retry
+POLL_SECONDS = 0.1      # how often waiting workers re-check for the winner's result
+
+# Never part of the cache key (secrets / cache-busters)
+IGNORED_PARAMS = {"apiKey"}
+
+IMMUTABLE_TTL = 30 * 24 * 3600
+
+# Minimum spacing between upstream requests per host (all threads in a process)
+HOST_MIN_INTERVAL = {"stats.nba.com": 0.6}
+
+
+def _as_dict(params) -> dict:
+    """nba_api passes params as a sorted list of (key, value) pairs."""
+    return dict(params or {})
+
+
+def ttl_for(url: str, params) -> float:
+    """Seconds a response stays fresh, matched to how often the data changes."""
+    url = url.lower()
+    params = _as_dict(params)
+
+    # Live CDN feeds
+    if "cdn.nba.com/static/json/livedata" in url:
+        if "playbyplay" in url:
+            return 3
+        return 5
+
+    # Odds
+    if "the-odds-api.com" in url:
+        return 5 * 60
+
+    # stats.nba.com
+    season = params.get("Season") or params.get("season")
+    if season and season != current_season():
+        return IMMUTABLE_TTL  # past seasons do not change
+    if "commonteamroster" in url:
+        return 6 * 3600
+    if "playerindex" in url:
+        return 24 * 3600
+    return 10 * 60
+
+
+def cache_key(url: str, params) -> str:
+    items = sorted(
+        (k, "" if v is None else str(v))
+        for k, v in _as_dict(params).items()
+        if k not in IGNORED_PARAMS
+    )
+    return f"{url}?{urlencode(items)}"
+
+
+# ---------------------------
+# Upstream request throttle
+# ---------------------------
+class Throttle:
+    """Spaces request starts across every thread that shares it."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._next - now, 0.0)
+            self._next = max(now, self._next) + self.min_interval
+        if delay:
+            time.sleep(delay)
+
+
+_throttles = {host: Throttle(gap) for host, gap in HOST_MIN_INTERVAL.items()}
+
+
+def throttle_for(url: str):
+    return _throttles.get(urlparse(url).hostname)
+
+
+# ---------------------------
+# SQLite store (shared by every worker process on the host)
+# ---------------------------
+class ResponseStore:
+    def __init__(self, path=None):
+        self.path = str(path or data_path(DB_FILE))
+        self._local = threading.local()
+        self._owner_prefix = f"{os.getpid()}-{id(self)}"
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status INTEGER, url TEXT, body BLOB, "
+                "stored_at REAL, expires_at REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "key TEXT PRIMARY KEY, owner TEXT, expires_at REAL)"
+            )
+
+    @property
+    def _owner(self) -> str:
+        # Per thread: a thread that fetched without a lease must not
+        # release one held by another thread of the same process
+        return f"{self._owner_prefix}-{threading.get_ident()}"
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, allow_stale: bool = False):
+        row = self._conn().execute(
+            "SELECT status, url, body, expires_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        if not allow_stale and row[3] < time.time():
+            return None
+        return row[:3]
+
+    def put(self, key: str, status: int, url: str, body: bytes, ttl: float):
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+            (key, status, url, body, now, now + ttl),
+        )
+
+    def acquire(self, key: str) -> bool:
+        """True if this worker should fetch; False if someone else already is."""
+        now = time.time()
+        cur = self._conn().execute(
+            "INSERT INTO leases VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE leases.expires_at < ?",
+            (key, self._owner, now + LEASE_SECONDS, now),
+        )
+        return cur.rowcount == 1
+
+    def release(self, key: str):
+        self._conn().execute(
+            "DELETE FROM leases WHERE key = ? AND owner = ?",
+            (key, self._owner),
+        )
+
+    def prune(self, older_than: float = 24 * 3600):
+        cutoff = time.time() - older_than
+        conn = self._conn()
+        conn.execute("DELETE FROM responses WHERE expires_at < ?", (cutoff,))
+        conn.execute("DELETE FROM leases WHERE expires_at < ?", (time.time(),))
+
+
+# ---------------------------
+# requests.Session that reads through the store
+# ---------------------------
+def _to_response(status: int, url: str, body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp.url = url
+    resp._content = body
+    resp.encoding = "utf-8"
+    resp.headers["Content-Type"] = "application/json"
+    return resp
+
+
+class CachingSession(requests.Session):
+    """
+    Drop-in Session for GET requests.
+
+    Fresh hits come from SQLite. On a miss, one worker across all processes
+    takes a short lease and fetches; the others wait for its result instead
+    of hitting upstream too (stampede protection). Upstream fetches are
+    spaced per host, so concurrent callers cannot burst stats.nba.com.
+    """
+
+    def __init__(self, store: ResponseStore = None):
+        super().__init__()
+        self.store = store or ResponseStore()
+
+    def get(self, url, params=None, **kwargs):
+        key = cache_key(url, params)
+
+        hit = self.store.get(key)
+        if hit:
+            return _to_response(*hit)
+
+        deadline = time.time() + LEASE_SECONDS
+        while not self.store.acquire(key):
+            time.sleep(POLL_SECONDS)
+            hit = self.store.get(key)
+            if hit:
+                return _to_response(*hit)
+            if time.time() > deadline:
+                break  # lease holder died; fetch ourselves
+
+        throttle = throttle_for(url)
+        if throttle:
+            throttle.wait()
+
+        try:
+            resp = super().get(url, params=params, **kwargs)
+            if resp.status_code == 200:
+                self.store.put(key, resp.status_code, resp.url, resp.content, ttl_for(url, params))
+        except requests.RequestException:
+            stale = self.store.get(key, allow_stale=True)
+            if stale:
+                return _to_response(*stale)
+            raise
+        finally:
+            self.store.release(key)  # only after the result is visible to waiters
+
+        return resp
+
+
+# ---------------------------
+# Install
+# ---------------------------
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_cached_session() -> CachingSession:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = CachingSession()
+            _session.store.prune()
+        return _session
+
+
+def install_http_cache() -> CachingSession:
+    """Route every nba_api request (stats + live) through the shared cache."""
+    from nba_api.library.http import NBAHTTP
+    from nba_api.live.nba.library.http import NBALiveHTTP
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    session = get_cached_session()
+    for cls in (NBAHTTP, NBAStatsHTTP, NBALiveHTTP):
+        cls.set_session(session)
+    return session
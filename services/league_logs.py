@@ -0,0 +1,57 @@
+import time
+import pandas as pd
+
+from nba_api.stats.endpoints import leaguegamelog, playerindex
+
+
+# ---------------------------
+# Config
+# ---------------------------
+STAT_COLS = ["MIN", "PTS", "REB", "AST", "FG3M"]
+
+
+# ---------------------------
+# League-wide fetches
+# ---------------------------
+def fetch_league_logs(season: str, player_or_team: str = "P") -> pd.DataFrame:
+    """
+    One request for every game log in a season.
+    player_or_team: "P" (player rows) or "T" (team rows).
+    """
+    df = leaguegamelog.LeagueGameLog(
+        season=season,
+        player_or_team_abbreviation=player_or_team,
+    ).get_data_frames()[0]
+
+    if df.empty:
+        return df
+
+    df = df.copy()
+    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], errors="coerce")
+    df = df.dropna(subset=["GAME_DATE"])
+    df["TEAM_ABBR"] = df["MATCHUP"].astype(str).str[:3]
+    df["OPP_ABBR"] = df["MATCHUP"].astype(str).str[-3:]
+    df["SEASON_USED"] = season
+
+    for col in STAT_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+
+    time.sleep(0.2)  # rate-limit safety
+    return df
+
+
+def fetch_player_positions(season: str) -> pd.DataFrame:
+    """
+    PLAYER_ID -> primary position (G / F / C).
+    'G-F' and 'F-C' collapse to their first listed position.
+    """
+    df = playerindex.PlayerIndex(season=season).get_data_frames()[0]
+    if df.empty:
+        return pd.DataFrame(columns=["PLAYER_ID", "POSITION"])
+
+    out = pd.DataFrame({
+        "PLAYER_ID": df["PERSON_ID"].astype(int),
+        "POSITION": df["POSITION"].fillna("").astype(str).str.split("-").str[0],
+    })
+    return out[out["POSITION"] != ""].reset_index(drop=True)
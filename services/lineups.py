@@ -4,6 +4,8 @@ import re
 from datetime import datetime
 from nba_api.live.nba.endpoints import scoreboard, boxscore
 
+from .live_tracker import LivePropTracker, TRACKABLE_STATS
+
 # --- HELPER FUNCTIONS ---
 
 def get_team_logo(team_id):
@@ -19,64 +21,200 @@ def format_nba_minutes(duration_str):
         return f"{match.group(1)}:{match.group(2).zfill(2)}"
     return "0:00"
 
-@st.cache_data(ttl=5) # Short cache to keep toggle snappy but data fresh
-def get_boxscore_data(game_id):
-    """Fetches player stats and on-court status."""
-    try:
-        box = boxscore.BoxScore(game_id)
-        data = box.get_dict().get('game', {})
+def process_players(players):
+    """Builds the display DataFrame for one team's boxscore players."""
+    stats_list = []
+    for p in players:
+        s = p.get('statistics', {})
         
-        def process_players(team_data):
-            players = team_data.get('players', [])
-            stats_list = []
-            for p in players:
-                s = p.get('statistics', {})
-                
-                # Identify if player is currently on the court (1 = Yes, 0 = No)
-                is_on_court = p.get('oncourt') == '1'
-                status_label = "🟢 ON" if is_on_court else "⚪ Bench"
-                
-                mins_raw = s.get('minutes', 'PT00M00S')
-                formatted_min = format_nba_minutes(mins_raw)
-                
-                # Filter: Include players who have played minutes or are currently on court
-                if formatted_min != "0:00" or is_on_court:
-                    stats_list.append({
-                        "Status": status_label,
-                        "Player": p.get('name'), 
-                        "MIN": formatted_min,
-                        "PTS": s.get('points', 0),
-                        "REB": s.get('reboundsTotal', 0),
-                        "AST": s.get('assists', 0),
-                        "3PM": s.get('threePointersMade', 0),
-                        "3PA": s.get('threePointersAttempted', 0),
-                        "3P%": s.get('threePointersPercentage', 0) * 100,
-                        "FTM": s.get('freeThrowsMade', 0),
-                        "FTA": s.get('freeThrowsAttempted', 0),
-                        "FT%": s.get('freeThrowsPercentage', 0) * 100,
-                        "+/-": s.get('plusMinusPoints', 0)
-                    })
-            
-            df = pd.DataFrame(stats_list)
-            if not df.empty:
-                # Sort: 'ON' players first, then by +/-
-                df = df.sort_values(by=["Status", "+/-"], ascending=[False, False])
-            return df
+        # Identify if player is currently on the court (1 = Yes, 0 = No)
+        is_on_court = p.get('oncourt') == '1'
+        status_label = "🟢 ON" if is_on_court else "⚪ Bench"
+        
+        mins_raw = s.get('minutes', 'PT00M00S')
+        formatted_min = format_nba_minutes(mins_raw)
         
-        return process_players(data.get('awayTeam', {})), process_players(data.get('homeTeam', {}))
+        # Filter: Include players who have played minutes or are currently on court
+        if formatted_min != "0:00" or is_on_court:
+            stats_list.append({
+                "Status": status_label,
+                "Player": p.get('name'), 
+                "MIN": formatted_min,
+                "PTS": s.get('points', 0),
+                "REB": s.get('reboundsTotal', 0),
+                "AST": s.get('assists', 0),
+                "3PM": s.get('threePointersMade', 0),
+                "3PA": s.get('threePointersAttempted', 0),
+                "3P%": s.get('threePointersPercentage', 0) * 100,
+                "FTM": s.get('freeThrowsMade', 0),
+                "FTA": s.get('freeThrowsAttempted', 0),
+                "FT%": s.get('freeThrowsPercentage', 0) * 100,
+                "+/-": s.get('plusMinusPoints', 0)
+            })
+    
+    df = pd.DataFrame(stats_list)
+    if not df.empty:
+        # Sort: 'ON' players first, then by +/-
+        df = df.sort_values(by=["Status", "+/-"], ascending=[False, False])
+    return df
+
+@st.cache_data(ttl=5) # Short cache to keep toggle snappy but data fresh
+def get_boxscore_raw(game_id):
+    """Raw away/home player lists from the live boxscore."""
+    try:
+        data = boxscore.BoxScore(game_id).get_dict().get('game', {})
+        return data.get('awayTeam', {}).get('players', []), data.get('homeTeam', {}).get('players', [])
+    except Exception:
+        return [], []
+
+# --- SNAPSHOT DIFFING ---
+
+DELTA_STATS = ["PTS", "REB", "AST", "3PM"]
+
+def get_snapshot(game_id):
+    """Previous-tick state for one game, kept for the session."""
+    return st.session_state.setdefault("live_snapshots", {}).setdefault(game_id, {})
+
+def add_deltas(cur, prev):
+    """Adds a 'Δ' column describing what changed per player since prev."""
+    cur = cur.copy()
+    if prev is None or prev.empty or cur.empty:
+        cur["Δ"] = ""
+        return cur
+
+    old = prev.set_index("Player")
+    changes = pd.Series("", index=cur.index)
+    for stat in DELTA_STATS:
+        diff = cur[stat] - cur["Player"].map(old[stat]).fillna(cur[stat])
+        changes += diff.map(lambda d, s=stat: f"+{int(d)} {s} " if d > 0 else "")
+    swapped = cur["Player"].map(old["Status"]).fillna(cur["Status"]) != cur["Status"]
+    changes = changes.where(~swapped, "↔ " + changes)
+    cur["Δ"] = changes.str.strip()
+    return cur
+
+SIG_FIELDS = [
+    'minutes', 'points', 'reboundsTotal', 'assists', 'threePointersMade',
+    'threePointersAttempted', 'freeThrowsMade', 'freeThrowsAttempted', 'plusMinusPoints',
+]
+
+def boxscore_signature(players):
+    """Cheap per-player fingerprint of exactly the fields the table shows."""
+    return tuple(
+        (p.get('personId'), p.get('oncourt'), *(p.get('statistics', {}).get(f) for f in SIG_FIELDS))
+        for p in players
+    )
+
+def get_boxscore_delta(game_id):
+    """
+    Boxscore frames with a 'Δ' column; rebuilt and re-sorted only when a
+    displayed player field changed. 'Δ' describes the change since the
+    previous refresh, so it is cleared on a refresh where nothing changed.
+    Returns (away_df, home_df, changed).
+    """
+    snap = get_snapshot(game_id)
+    away, home = get_boxscore_raw(game_id)
+    sig = (boxscore_signature(away), boxscore_signature(home))
+
+    if snap.get("box_sig") == sig:
+        if snap.get("has_delta"):
+            snap.update(
+                a_df=snap["a_df"].assign(**{"Δ": ""}),
+                h_df=snap["h_df"].assign(**{"Δ": ""}),
+                has_delta=False,
+            )
+        return snap["a_df"], snap["h_df"], False
+
+    a_df = add_deltas(process_players(away), snap.get("a_df"))
+    h_df = add_deltas(process_players(home), snap.get("h_df"))
+    snap.update(box_sig=sig, a_df=a_df, h_df=h_df, has_delta=True)
+    return a_df, h_df, True
+
+@st.cache_data(ttl=5)
+def get_scoreboard_games():
+    """Today's games from the live scoreboard."""
+    try:
+        board = scoreboard.ScoreBoard()
+        return board.get_dict().get('scoreboard', {}).get('games', [])
     except Exception:
-        return pd.DataFrame(), pd.DataFrame()
+        return []
+
+@st.cache_data(ttl=300)
+def get_game_roster(game_id):
+    """personId -> 'Name (TRI)' for both teams, used by the prop tracker picker."""
+    try:
+        data = boxscore.BoxScore(game_id).get_dict().get('game', {})
+    except Exception:
+        return {}
+    roster = {}
+    for side in ('awayTeam', 'homeTeam'):
+        team = data.get(side, {})
+        for p in team.get('players', []):
+            roster[p.get('personId')] = f"{p.get('name')} ({team.get('teamTricode', '')})"
+    return roster
+
+# --- LIVE PROP TRACKER ---
+
+@st.cache_resource
+def get_tracker(game_id):
+    """One incremental play-by-play tracker per game, shared by every session."""
+    return LivePropTracker(game_id)
+
+def pin_prop_form(live_games):
+    """Lets the user pin (player, stat, line) for a live game."""
+    with st.expander("📌 Pin a live prop", expanded=False):
+        if not live_games:
+            st.caption("Props can be pinned once a game tips off.")
+            return
+        games = {g['gameId']: f"{g['awayTeam']['teamTricode']} @ {g['homeTeam']['teamTricode']}" for g in live_games}
+        c1, c2, c3, c4 = st.columns([2, 3, 2, 1])
+        with c1: game_id = st.selectbox("Game", list(games), format_func=games.get, key="pin_game")
+        roster = get_game_roster(game_id)
+        with c2: person_id = st.selectbox("Player", list(roster), format_func=lambda x: roster.get(x, str(x)), key="pin_player")
+        with c3: stat = st.selectbox("Stat", TRACKABLE_STATS, key="pin_stat")
+        with c4: line = st.number_input("Line", min_value=0.0, value=20.5, step=0.5, key="pin_line")
+        if st.button("Pin prop") and person_id:
+            st.session_state.setdefault("live_pins", []).append({
+                "game_id": game_id, "person_id": person_id,
+                "name": roster.get(person_id, str(person_id)), "stat": stat, "line": float(line),
+            })
+
+def render_prop_tracker():
+    """Progress and pace for every pinned prop; one play-by-play delta per game."""
+    pins = st.session_state.get("live_pins", [])
+    if not pins:
+        return
+
+    st.subheader("📌 Prop Tracker")
+    for game_id in {p["game_id"] for p in pins}:
+        try:
+            get_tracker(game_id).update()
+        except Exception:
+            pass  # keep last known counters on a failed tick
+
+    for i, pin in enumerate(pins):
+        tracker = get_tracker(pin["game_id"])
+        prog = tracker.progress(pin["person_id"], pin["stat"], pin["line"])
+        label = (
+            f"{'✅' if prog['hit'] else '⏳'} {pin['name']} — {pin['stat']} "
+            f"{prog['current']} / {pin['line']} • pace {prog['pace']:.1f} • Q{tracker.period}"
+        )
+        c1, c2 = st.columns([6, 1])
+        with c1: st.progress(prog["pct"], text=label)
+        with c2:
+            if st.button("✖", key=f"unpin_{i}"):
+                pins.pop(i)
+                st.rerun(scope="fragment")
+    st.divider()
 
 # --- UI COMPONENT ---
 
-def render_game_card(g):
-    """Renders the HTML Scorecard and the Stats Expander."""
-    status_text = g.get('gameStatusText', 'Unknown')
+def build_card_html(g, flash=False):
+    """Scorecard HTML (no clock); flash outlines the card when the score just changed."""
     game_status = g.get('gameStatus') # 1: Scheduled, 2: Live, 3: Final
     score_html = "VS" if game_status == 1 else f"{g['awayTeam']['score']} — {g['homeTeam']['score']}"
     
-    st.markdown(f"""
-    <div style="background:#111; border-radius:15px; padding:20px; border:1px solid #333; margin-bottom:10px;">
+    return f"""
+    <div style="background:#111; border-radius:15px; padding:20px; border:1px solid {'#FF4B4B' if flash else '#333'}; margin-bottom:10px;">
         <div style="display:flex; justify-content:space-between; align-items:center;">
             <div style="text-align:center; flex:1;">
                 <img src="{get_team_logo(g['awayTeam']['teamId'])}" style="width:45px;">
@@ -84,7 +222,6 @@ def render_game_card(g):
             </div>
             <div style="text-align:center; flex:1;">
                 <div style="font-size:22px; font-weight:900; color:white;">{score_html}</div>
-                <div style="color:{'#FF4B4B' if game_status == 2 else '#00FF00' if game_status == 3 else '#777'}; font-size:10px; font-weight:bold;">{status_text}</div>
             </div>
             <div style="text-align:center; flex:1;">
                 <img src="{get_team_logo(g['homeTeam']['teamId'])}" style="width:45px;">
@@ -92,21 +229,44 @@ def render_game_card(g):
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def build_status_html(g):
+    """Status / game clock line, rendered on its own so the card can stay cached."""
+    game_status = g.get('gameStatus')
+    color = '#FF4B4B' if game_status == 2 else '#00FF00' if game_status == 3 else '#777'
+    return (
+        f'<div style="text-align:center; color:{color}; font-size:10px; font-weight:bold; margin:-6px 0 10px;">'
+        f'{g.get("gameStatusText", "Unknown")}</div>'
+    )
+
+def render_game_card(g):
+    """Renders the HTML Scorecard and the Stats Expander."""
+    game_status = g.get('gameStatus') # 1: Scheduled, 2: Live, 3: Final
+    snap = get_snapshot(g.get('gameId'))
+
+    # Rebuild the card HTML only when status/period/score moved (not the clock)
+    card_sig = (game_status, g.get('period'), g['awayTeam'].get('score'), g['homeTeam'].get('score'))
+    if snap.get("card_sig") != card_sig:
+        scored = snap.get("card_sig") is not None and snap["card_sig"][2:] != card_sig[2:]
+        snap.update(card_sig=card_sig, card_html=build_card_html(g, flash=scored))
+    st.markdown(snap["card_html"], unsafe_allow_html=True)
+    st.markdown(build_status_html(g), unsafe_allow_html=True)
 
     if game_status != 1:
         with st.expander(f"📊 Stats: {g['awayTeam']['teamTricode']} @ {g['homeTeam']['teamTricode']}", expanded=False):
-            a_df, h_df = get_boxscore_data(g.get('gameId'))
+            a_df, h_df, _ = get_boxscore_delta(g.get('gameId'))
             
             # Robust Column Configuration (No styling to prevent AttributeError)
             col_cfg = {
                 "Status": st.column_config.TextColumn("Status", width="small"),
                 "Player": st.column_config.TextColumn("Player", width="medium"),
+                "Δ": st.column_config.TextColumn("Δ", width="small", help="Changed since last refresh"),
                 "3P%": st.column_config.NumberColumn("3P%", format="%.0f%%"),
                 "FT%": st.column_config.NumberColumn("FT%", format="%.0f%%"),
                 "+/-": st.column_config.NumberColumn("+/-", format="%d")
             }
-            display_cols = ["Status", "Player", "MIN", "PTS", "REB", "AST", "3PM", "3PA", "3P%", "FTM", "FTA", "FT%", "+/-"]
+            display_cols = ["Status", "Player", "Δ", "MIN", "PTS", "REB", "AST", "3PM", "3PA", "3P%", "FTM", "FTA", "FT%", "+/-"]
             
             if not a_df.empty:
                 t1, t2 = st.tabs([g['awayTeam']['teamTricode'], g['homeTeam']['teamTricode']])
@@ -121,11 +281,7 @@ def render_game_card(g):
 @st.fragment(run_every="10s")
 def scoreboard_zone(hide_static):
     """Refreshes the entire scoreboard every 10 seconds."""
-    try:
-        board = scoreboard.ScoreBoard()
-        all_games = board.get_dict().get('scoreboard', {}).get('games', [])
-    except Exception:
-        all_games = []
+    all_games = get_scoreboard_games()
 
     if not all_games:
         st.warning("No games found.")
@@ -135,6 +291,8 @@ def scoreboard_zone(hide_static):
     upcoming_games = [g for g in all_games if g.get('gameStatus') == 1]
     final_games = [g for g in all_games if g.get('gameStatus') == 3]
 
+    render_prop_tracker()
+
     # 1. LIVE SECTION (Top)
     if live_games:
         st.subheader("🔥 Live Action")
@@ -164,6 +322,8 @@ def show_lineups_page(team_id_map):
     
     # Persistent Toggle
     hide_static = st.toggle("Focus on Live Action Only", value=False)
+
+    pin_prop_form([g for g in get_scoreboard_games() if g.get('gameStatus') == 2])
     
     # Launch Fragment
     scoreboard_zone(hide_static)
\ No newline at end of file
@@ -0,0 +1,158 @@
+import re
+import threading
+import time
+
+from nba_api.live.nba.endpoints import playbyplay
+
+
+# ---------------------------
+# Config
+# ---------------------------
+BASE_STATS = ["PTS", "REB", "AST", "FG3M"]
+
+COMBO_STATS = {
+    "Pts+Reb+Ast": ["PTS", "REB", "AST"],
+    "Pts+Reb": ["PTS", "REB"],
+    "Pts+Ast": ["PTS", "AST"],
+    "Reb+Ast": ["REB", "AST"],
+}
+
+TRACKABLE_STATS = BASE_STATS + list(COMBO_STATS)
+
+REGULATION_MINUTES = 48.0
+
+TAIL_CHECK = 20          # recent folded actions re-checked each tick for in-place edits
+MIN_UPDATE_SECONDS = 5.0  # sessions sharing a tracker fetch at most this often
+
+
+def _clock_minutes(clock: str) -> float:
+    """'PT07M32.00S' -> 7.53 minutes remaining in the period."""
+    match = re.search(r"PT(\d+)M([\d.]+)S", clock or "")
+    if not match:
+        return 0.0
+    return int(match.group(1)) + float(match.group(2)) / 60.0
+
+
+# ---------------------------
+# Incremental play-by-play tracker
+# ---------------------------
+class LivePropTracker:
+    """
+    Running per-player counters for one game.
+
+    The feed is ordered by orderNumber, so a play entered late can land
+    mid-list with a higher actionNumber. Each update() therefore folds in
+    only the actions whose actionNumber it hasn't folded yet, wherever they
+    sit. The already-folded actions are fingerprinted (count, latest
+    `edited` stamp and the last TAIL_CHECK of them); if any of that
+    changed, the counters are rebuilt from scratch.
+
+    Safe to share across sessions: the fetch and fold run outside the lock,
+    and only the finished state is swapped in under it.
+    """
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self.last_action = 0
+        self.period = 0
+        self.clock = ""
+        self.counters = {}
+        self._folded = frozenset()
+        self._fingerprint = None
+        self._updated_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fingerprint_of(folded: list) -> tuple:
+        latest_edit = max((a.get("edited") or "" for a in folded), default="")
+        tail = tuple(
+            (a.get("actionNumber"), a.get("edited"), a.get("actionType"), a.get("personId"),
+             a.get("shotResult"), a.get("assistPersonId"))
+            for a in folded[-TAIL_CHECK:]
+        )
+        return len(folded), latest_edit, tail
+
+    @staticmethod
+    def _bump(counters: dict, person_id, stat: str, amount: int = 1):
+        if not person_id:
+            return  # team rebounds / team turnovers carry personId 0
+        row = counters.setdefault(int(person_id), dict.fromkeys(BASE_STATS, 0))
+        row[stat] += amount
+
+    @classmethod
+    def _fold(cls, counters: dict, action: dict):
+        kind = action.get("actionType")
+        made = action.get("shotResult") == "Made"
+        pid = action.get("personId")
+
+        if kind in ("2pt", "3pt") and made:
+            cls._bump(counters, pid, "PTS", 3 if kind == "3pt" else 2)
+            if kind == "3pt":
+                cls._bump(counters, pid, "FG3M")
+            cls._bump(counters, action.get("assistPersonId"), "AST")
+        elif kind == "freethrow" and made:
+            cls._bump(counters, pid, "PTS")
+        elif kind == "rebound" and "team" not in action.get("qualifiers", []):
+            cls._bump(counters, pid, "REB")
+
+    def update(self) -> int:
+        """Fetch play-by-play and fold new actions. Returns how many were folded."""
+        with self._lock:
+            if time.monotonic() - self._updated_at < MIN_UPDATE_SECONDS:
+                return 0  # another session just refreshed this game
+            self._updated_at = time.monotonic()
+            seen, fingerprint = self._folded, self._fingerprint
+            counters = {pid: dict(row) for pid, row in self.counters.items()}
+
+        # Network and parsing happen without the lock, so readers never wait on them
+        data = playbyplay.PlayByPlay(self.game_id).get_dict().get("game", {})
+        actions = data.get("actions", [])
+
+        folded = [a for a in actions if a.get("actionNumber") in seen]
+        if fingerprint is not None and self._fingerprint_of(folded) != fingerprint:
+            # Folded actions edited or removed -> rebuild from scratch
+            counters, new_actions = {}, actions
+        else:
+            new_actions = [a for a in actions if a.get("actionNumber") not in seen]
+
+        for action in new_actions:
+            self._fold(counters, action)
+
+        with self._lock:
+            self.counters = counters
+            self._folded = frozenset(a.get("actionNumber") for a in actions)
+            self._fingerprint = self._fingerprint_of(actions)
+            if actions:
+                last = actions[-1]  # latest in game order
+                self.last_action = max(self._folded, default=self.last_action)
+                self.period = last.get("period", self.period)
+                self.clock = last.get("clock", self.clock)
+        return len(new_actions)
+
+    # ---------------------------
+    # Read side
+    # ---------------------------
+    def value(self, person_id: int, stat: str) -> int:
+        row = self.counters.get(int(person_id), {})
+        parts = COMBO_STATS.get(stat, [stat])
+        return sum(row.get(p, 0) for p in parts)
+
+    def minutes_elapsed(self) -> float:
+        if self.period <= 0:
+            return 0.0
+        period_len = 12.0 if self.period <= 4 else 5.0
+        done = min(self.period - 1, 4) * 12.0 + max(self.period - 5, 0) * 5.0
+        return done + period_len - _clock_minutes(self.clock)
+
+    def progress(self, person_id: int, stat: str, line: float) -> dict:
+        """Current value, share of the line reached and full-game pace."""
+        with self._lock:  # counters and clock from the same update
+            current = self.value(person_id, stat)
+            elapsed = self.minutes_elapsed()
+        pace = current * REGULATION_MINUTES / elapsed if elapsed > 0 else 0.0
+        return {
+            "current": current,
+            "pct": min(current / line, 1.0) if line > 0 else 0.0,
+            "pace": pace,
+            "hit": current > line,
+        }
@@ -0,0 +1,186 @@
+import time
+
+import pandas as pd
+
+from .league_logs import fetch_league_logs, fetch_player_positions
+from .storage import current_season, load_frame, save_frame
+
+
+# ---------------------------
+# Config
+# ---------------------------
+ALLOWED_STATS = ["PTS", "REB", "AST", "FG3M"]
+POSITIONS = ["G", "F", "C"]
+
+FACTS_FILE = "opp_position_games.pkl"
+PENDING_FILE = "opp_position_pending.pkl"
+POSITIONS_FILE = "player_positions.pkl"
+
+POSITION_MISS_TTL = 24 * 3600  # re-ask PlayerIndex about unlisted players daily
+
+RAW_COLS = ["PLAYER_ID", "OPP_ABBR", "GAME_ID", "GAME_DATE"] + ALLOWED_STATS
+FACT_KEYS = ["OPP_ABBR", "POSITION", "GAME_ID", "GAME_DATE"]
+
+
+def _table_file(last_n: int) -> str:
+    return f"opp_position_L{last_n}.pkl"
+
+
+# ---------------------------
+# Positions (refreshed only for unseen players)
+# ---------------------------
+def _positions_for(season: str, player_ids) -> pd.DataFrame:
+    """
+    Known positions, fetching PlayerIndex only for never-seen IDs.
+    IDs PlayerIndex doesn't list are stored with POSITION "" so they don't
+    trigger a refetch on every update; after POSITION_MISS_TTL they're
+    asked about again. Only resolved positions are returned.
+    """
+    now = time.time()
+    positions = load_frame(POSITIONS_FILE)
+    if positions.empty:
+        positions = pd.DataFrame(columns=["PLAYER_ID", "POSITION", "CHECKED_AT"])
+    elif "CHECKED_AT" not in positions.columns:
+        positions["CHECKED_AT"] = now
+
+    missed = positions["POSITION"] == ""
+    known = set(positions.loc[~missed | (positions["CHECKED_AT"] > now - POSITION_MISS_TTL), "PLAYER_ID"])
+
+    unseen = set(player_ids) - known
+    if unseen:
+        fresh = fetch_player_positions(season).assign(CHECKED_AT=now)
+        missing = pd.DataFrame({
+            "PLAYER_ID": sorted(unseen - set(fresh["PLAYER_ID"])),
+            "POSITION": "",
+            "CHECKED_AT": now,
+        })
+        positions = (
+            pd.concat([positions, missing, fresh], ignore_index=True)
+            .drop_duplicates("PLAYER_ID", keep="last")
+            .reset_index(drop=True)
+        )
+        save_frame(positions, POSITIONS_FILE)
+
+    return positions[positions["POSITION"] != ""]
+
+
+def load_position_map() -> dict:
+    """PLAYER_ID -> 'G' / 'F' / 'C'."""
+    positions = load_frame(POSITIONS_FILE)
+    if positions.empty:
+        return {}
+    positions = positions[positions["POSITION"] != ""]
+    return dict(zip(positions["PLAYER_ID"], positions["POSITION"]))
+
+
+# ---------------------------
+# Aggregation
+# ---------------------------
+def _aggregate_last_n(facts: pd.DataFrame, last_n: int) -> pd.DataFrame:
+    """Average allowed per opponent/position over that opponent's last N games."""
+    recent = (
+        facts.sort_values("GAME_DATE", ascending=False)
+        .groupby(["OPP_ABBR", "POSITION"], sort=False)
+        .head(last_n)
+    )
+    grouped = recent.groupby(["OPP_ABBR", "POSITION"])
+    table = grouped[ALLOWED_STATS].mean().round(2)
+    table["GAMES"] = grouped.size()
+    return table.reset_index()
+
+
+def _add_ranks(table: pd.DataFrame) -> pd.DataFrame:
+    """Rank 1 = most allowed to that position (softest matchup)."""
+    table = table.copy()
+    for stat in ALLOWED_STATS:
+        table[f"{stat}_RANK"] = (
+            table.groupby("POSITION")[stat]
+            .rank(ascending=False, method="min")
+            .astype(int)
+        )
+    return table
+
+
+def update_matchup_tables(season: str = None, last_n: int = 10) -> pd.DataFrame:
+    """
+    Ingest new league games into the materialized tables.
+
+    Only games not already ingested are grouped, and only the opponents
+    that played in them get their last-N rows recomputed. Player rows whose
+    position isn't known yet are parked in a pending frame and folded into
+    their game's facts once it is, so no one's minutes are lost for good.
+    """
+    season = season or current_season()
+
+    facts = load_frame(FACTS_FILE)
+    table = load_frame(_table_file(last_n))
+    pending = load_frame(PENDING_FILE)
+    if pending.empty:
+        pending = pd.DataFrame(columns=RAW_COLS)
+
+    logs = fetch_league_logs(season, "P")
+    if logs.empty and pending.empty:
+        return table
+
+    seen = set(pending["GAME_ID"]) | (set(facts["GAME_ID"]) if not facts.empty else set())
+    new = logs[~logs["GAME_ID"].isin(seen)][RAW_COLS] if not logs.empty else pending.iloc[:0]
+    candidates = pd.concat([pending, new], ignore_index=True)
+
+    if candidates.empty and not table.empty:
+        return table
+
+    touched = set()
+    if not candidates.empty:
+        positions = _positions_for(season, candidates["PLAYER_ID"].unique())
+        candidates = candidates.merge(positions[["PLAYER_ID", "POSITION"]], on="PLAYER_ID", how="left")
+        resolved = candidates[candidates["POSITION"].notna()]
+
+        pending = candidates[candidates["POSITION"].isna()].drop(columns="POSITION")
+        save_frame(pending.reset_index(drop=True), PENDING_FILE)
+
+        if not resolved.empty:
+            added = resolved.groupby(FACT_KEYS)[ALLOWED_STATS].sum().reset_index()
+            # Late-resolved rows land in games already in facts: re-sum per key
+            facts = (
+                pd.concat([facts, added], ignore_index=True)
+                .groupby(FACT_KEYS)[ALLOWED_STATS].sum()
+                .reset_index()
+            )
+            save_frame(facts, FACTS_FILE)
+            touched = set(added["OPP_ABBR"])
+
+    if facts.empty:
+        return table
+    if table.empty:
+        touched = set(facts["OPP_ABBR"])
+    if not touched:
+        return table
+
+    # Rebuild only the touched opponents; everyone else is already current
+    if not table.empty:
+        table = table[~table["OPP_ABBR"].isin(touched)]
+        table = table[["OPP_ABBR", "POSITION", "GAMES"] + ALLOWED_STATS]
+
+    refreshed = _aggregate_last_n(facts[facts["OPP_ABBR"].isin(touched)], last_n)
+    table = pd.concat([table, refreshed], ignore_index=True)
+    table = _add_ranks(table)
+
+    save_frame(table, _table_file(last_n))
+    return table
+
+
+# ---------------------------
+# O(1) lookups for the UI
+# ---------------------------
+def load_matchup_table(last_n: int = 10) -> pd.DataFrame:
+    return load_frame(_table_file(last_n))
+
+
+def matchup_lookup(table: pd.DataFrame) -> dict:
+    """(OPP_ABBR, POSITION) -> row dict."""
+    if table.empty:
+        return {}
+    return {
+        (row["OPP_ABBR"], row["POSITION"]): row
+        for row in table.to_dict("records")
+    }
@@ -1,10 +1,19 @@
 import time
+import threading
+import warnings
 import pandas as pd
-from functools import lru_cache
+from collections import OrderedDict
 
 from nba_api.stats.static import players
 from nba_api.stats.endpoints import playergamelog
 
+from .schedule_context import add_schedule_context
+
+DEFAULT_END_YEAR = 2026
+DEFAULT_YEARS_BACK = 5
+
+LOGS_CACHE_TTL = 60 * 60      # seconds before a player's logs are refetched
+LOGS_CACHE_SIZE = 512
 
 # ---------------------------
 # Rolling feature helper
@@ -48,11 +57,46 @@ def add_rolling_features(df: pd.DataFrame, cols=None) -> pd.DataFrame:
 
 
 # ---------------------------
-# Cached wrapper
+# Cached wrapper (process-wide TTL cache; shared with the slate prewarmer)
 # ---------------------------
-@lru_cache(maxsize=128)
-def fetch_player_logs_cached(player_name: str, end_year: int, years_back: int):
-    return fetch_player_logs(player_name, end_year, years_back)
+_logs_cache = OrderedDict()
+_logs_lock = threading.Lock()
+
+
+def fetch_player_logs_cached(
+    player_name: str,
+    end_year: int = DEFAULT_END_YEAR,
+    years_back: int = DEFAULT_YEARS_BACK,
+    max_age: float = LOGS_CACHE_TTL,
+) -> pd.DataFrame:
+    """
+    Logs from the process-wide cache if fetched within `max_age` seconds,
+    otherwise refetched. The prewarmer passes a shorter max_age so entries
+    are renewed before users ever see them expire.
+    """
+    key = (player_name, end_year, years_back)
+    now = time.time()
+
+    with _logs_lock:
+        hit = _logs_cache.get(key)
+        if hit and now - hit[0] < max_age:
+            _logs_cache.move_to_end(key)
+            return hit[1]
+
+    logs = fetch_player_logs(player_name, end_year, years_back)
+
+    with _logs_lock:
+        _logs_cache[key] = (now, logs)
+        _logs_cache.move_to_end(key)
+        while len(_logs_cache) > LOGS_CACHE_SIZE:
+            _logs_cache.popitem(last=False)
+
+    return logs
+
+
+def logs_cache_size() -> int:
+    with _logs_lock:
+        return len(_logs_cache)
 
 
 # ---------------------------
@@ -60,8 +104,8 @@ def fetch_player_logs_cached(player_name: str, end_year: int, years_back: int):
 # ---------------------------
 def fetch_player_logs(
     player_name: str,
-    end_year: int = 2026,
-    years_back: int = 5
+    end_year: int = DEFAULT_END_YEAR,
+    years_back: int = DEFAULT_YEARS_BACK
 ) -> pd.DataFrame:
     """
     Fetch multi-season NBA game logs for a single player.
@@ -174,4 +218,13 @@ def fetch_player_logs(
         ]
     )
 
+    # ---------------------------
+    # Rest / schedule context (league-wide, cached per season)
+    # ---------------------------
+    try:
+        logs = add_schedule_context(logs)
+    except Exception as e:
+        # Logs stay usable; rest/venue filters refuse to run without context
+        warnings.warn(f"Schedule context unavailable for {player_name}: {e}")
+
     return logs
\ No newline at end of file
@@ -0,0 +1,198 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from nba_api.live.nba.endpoints import scoreboard
+from nba_api.stats.endpoints import commonteamroster
+from nba_api.stats.static import players
+
+from .http_cache import install_http_cache
+from .league_logs import fetch_league_logs
+from .matchups import update_matchup_tables
+from .storage import current_season
+from .nba_player_logs import (
+    DEFAULT_END_YEAR,
+    DEFAULT_YEARS_BACK,
+    fetch_player_logs_cached,
+)
+
+
+# ---------------------------
+# Config
+# ---------------------------
+ROTATION_MIN_MINUTES = 10.0   # season MPG to count as a rotation player
+MAX_WORKERS = 3               # concurrent player fetches (requests are
+                              # spaced per host by the HTTP session)
+RESCAN_SECONDS = 30 * 60      # re-read the slate; also the max age of warmed logs
+
+
+# ---------------------------
+# Process-wide state (read by the admin panel)
+# ---------------------------
+_lock = threading.Lock()
+_thread = None
+_status = {
+    "state": "idle",
+    "slate_date": None,
+    "games": [],
+    "total": 0,
+    "done": 0,
+    "failed": [],
+    "current": None,
+    "started_at": None,
+    "finished_at": None,
+    "last_error": None,
+}
+
+
+def prewarm_status() -> dict:
+    with _lock:
+        return {**_status, "games": list(_status["games"]), "failed": list(_status["failed"])}
+
+
+def _set(**kwargs):
+    with _lock:
+        _status.update(kwargs)
+
+
+# ---------------------------
+# Slate resolution
+# ---------------------------
+def todays_games() -> list:
+    """Today's scheduled/live games, earliest tip-off first."""
+    games = scoreboard.ScoreBoard().get_dict().get("scoreboard", {}).get("games", [])
+    games = [g for g in games if g.get("gameStatus") in (1, 2)]
+    return sorted(games, key=lambda g: g.get("gameTimeUTC", ""))
+
+
+def cache_name(player_id: int, roster_name: str) -> str:
+    """
+    The static full_name the app looks players up by (roster spellings can
+    differ, e.g. diacritics or suffixes); roster name if not in the index.
+    """
+    found = players.find_player_by_id(int(player_id))
+    return found["full_name"] if found else roster_name
+
+
+def rotation_players(team_id: int, season: str, minutes: dict) -> list:
+    """Player names as the app keys them, rotation players first (by season MPG)."""
+    roster = commonteamroster.CommonTeamRoster(
+        team_id=team_id,
+        season=season,
+    ).get_data_frames()[0]
+
+    if roster.empty:
+        return []
+
+    roster = roster.assign(MPG=roster["PLAYER_ID"].map(minutes).fillna(0.0))
+    rotation = roster[roster["MPG"] >= ROTATION_MIN_MINUTES]
+    if rotation.empty:
+        rotation = roster  # early season: no minutes yet, warm everyone
+
+    rotation = rotation.sort_values("MPG", ascending=False)
+    return [cache_name(pid, name) for pid, name in zip(rotation["PLAYER_ID"], rotation["PLAYER"])]
+
+
+def build_slate_queue(season: str = None) -> list:
+    """[(tip_off_utc, matchup, player_name), ...] in priority order."""
+    season = season or current_season()
+    games = todays_games()
+
+    try:
+        logs = fetch_league_logs(season, "P")
+        minutes = logs.groupby("PLAYER_ID")["MIN"].mean().to_dict()
+    except Exception:
+        minutes = {}
+
+    queue = []
+    for g in games:
+        matchup = f"{g['awayTeam']['teamTricode']} @ {g['homeTeam']['teamTricode']}"
+        for side in ("awayTeam", "homeTeam"):
+            names = rotation_players(g[side]["teamId"], season, minutes)
+            queue.extend((g.get("gameTimeUTC", ""), matchup, n) for n in names)
+
+    return queue
+
+
+# ---------------------------
+# Runner
+# ---------------------------
+def _warm_player(name: str, refresh_age: float):
+    _set(current=name)
+    try:
+        # Refetch anything older than one rescan, so entries are renewed
+        # well inside LOGS_CACHE_TTL and new games appear for users
+        fetch_player_logs_cached(name, DEFAULT_END_YEAR, DEFAULT_YEARS_BACK, max_age=refresh_age)
+    except Exception as e:
+        with _lock:
+            _status["failed"].append(f"{name}: {e}")
+    finally:
+        with _lock:
+            _status["done"] += 1
+
+
+def run_slate(max_workers: int = MAX_WORKERS, refresh_age: float = RESCAN_SECONDS):
+    """Warm odds, matchup tables and logs (with rolling features) for tonight's slate."""
+    _set(state="resolving", started_at=datetime.now(), finished_at=None,
+         done=0, failed=[], current=None, last_error=None)
+
+    queue = build_slate_queue()
+    _set(
+        state="warming",
+        slate_date=datetime.now().date(),
+        games=list(dict.fromkeys(m for _, m, _ in queue)),
+        total=len(queue) + 1,
+    )
+
+    # Odds are one league-wide call; warm the shared HTTP cache up front.
+    # load_au_odds raises (fetch_au_odds would only st.error in this thread)
+    try:
+        from .odds_provider import load_au_odds
+        load_au_odds()
+    except Exception as e:
+        _set(last_error=f"odds: {e}")
+    finally:
+        with _lock:
+            _status["done"] += 1
+
+    # League-wide matchup tables: one incremental update per rescan
+    try:
+        update_matchup_tables()
+    except Exception as e:
+        _set(last_error=f"matchups: {e}")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # map() submits in queue order, so earliest tip-off is fetched first
+        list(pool.map(lambda item: _warm_player(item[2], refresh_age), queue))
+
+    _set(state="done", current=None, finished_at=datetime.now())
+
+
+def _loop(max_workers: int, rescan_seconds: int):
+    while True:
+        try:
+            run_slate(max_workers, refresh_age=rescan_seconds)
+        except Exception as e:
+            _set(state="error", last_error=str(e), finished_at=datetime.now())
+        time.sleep(rescan_seconds)
+
+
+def start_prewarm(
+    max_workers: int = MAX_WORKERS,
+    rescan_seconds: int = RESCAN_SECONDS,
+) -> threading.Thread:
+    """Start the background scheduler once per process."""
+    global _thread
+    install_http_cache()  # every upstream request goes through the throttled session
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return _thread
+        _thread = threading.Thread(
+            target=_loop,
+            args=(max_workers, rescan_seconds),
+            name="slate-prewarm",
+            daemon=True,
+        )
+        _thread.start()
+        return _thread
@@ -0,0 +1,113 @@
+import numpy as np
+from statistics import NormalDist
+
+
+# ---------------------------
+# Helpers
+# ---------------------------
+def recency_weights(n: int, half_life: float = None) -> np.ndarray:
+    """
+    Normalised weights for n games ordered newest → oldest.
+    half_life=None gives equal weights.
+    """
+    if n == 0:
+        return np.empty(0)
+    if not half_life:
+        return np.full(n, 1.0 / n)
+    w = 0.5 ** (np.arange(n) / float(half_life))
+    return w / w.sum()
+
+
+def hit_matrix(values, lines, side: str = "Over") -> np.ndarray:
+    """
+    values: (n,) or (n, S) game results, newest first.
+    lines:  (L,) or (S, L) prop lines.
+    Returns a (n, S*L) float matrix of 1.0 (hit) / 0.0 (miss).
+    """
+    values = np.asarray(values, dtype=float)
+    lines = np.asarray(lines, dtype=float)
+
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+    if lines.ndim == 1:
+        lines = np.broadcast_to(lines, (values.shape[1], lines.shape[0]))
+
+    v = values[:, :, None]
+    t = lines[None, :, :]
+    hits = v > t if side == "Over" else v < t
+    return hits.reshape(values.shape[0], lines.size).astype(float)
+
+
+# ---------------------------
+# Probability engine
+# ---------------------------
+def hit_probability(
+    values,
+    lines,
+    side: str = "Over",
+    n_boot: int = 2000,
+    half_life: float = None,
+    prior_rate=None,
+    prior_strength: float = 10.0,
+    ci: float = 0.90,
+    seed: int = 0,
+) -> dict:
+    """
+    Hit probabilities with uncertainty for every stat/line at once.
+
+    raw                 weighted hit rate
+    boot_lo / boot_hi   bootstrap percentile interval
+    shrunk              Beta-Binomial posterior mean (pulled toward prior_rate)
+    bayes_lo / bayes_hi posterior credible interval (normal approx.)
+
+    Hits are 0/1, so a resample's hit count per column is exactly
+    Binomial(n, raw); the bootstrap draws those (n_boot, S*L) counts
+    directly instead of resampling the n games.
+    Arrays come back shaped like `lines` (or (S, L) for 2-D values).
+    prior_rate may be a scalar, one rate per stat (S,) or per cell (S, L).
+    """
+    values = np.asarray(values, dtype=float)
+    lines = np.asarray(lines, dtype=float)
+    hits = hit_matrix(values, lines, side)
+    n, k = hits.shape
+
+    out_shape = lines.shape if values.ndim == 1 else (values.shape[1], k // values.shape[1])
+    if n == 0:
+        nan = np.full(out_shape, np.nan)
+        return {key: nan for key in ["raw", "boot_lo", "boot_hi", "shrunk", "bayes_lo", "bayes_hi"]}
+
+    rng = np.random.default_rng(seed)
+    w = recency_weights(n, half_life)
+    q = [(1 - ci) / 2 * 100, (1 + ci) / 2 * 100]
+
+    # Point estimate
+    raw = w @ hits
+
+    # Bootstrap: n weighted draws of 0/1 outcomes hit with probability raw,
+    # so each column's resampled hit count is exactly Binomial(n, raw)
+    boot = rng.binomial(n, np.clip(raw, 0.0, 1.0), size=(n_boot, k)) / n
+    boot_lo, boot_hi = np.percentile(boot, q, axis=0)
+
+    # Beta-Binomial shrinkage using the effective sample size of the weights
+    n_eff = 1.0 / np.sum(w ** 2)
+    prior = np.asarray(0.5 if prior_rate is None else prior_rate, dtype=float)
+    if prior.ndim == 1 and len(out_shape) == 2:
+        prior = prior[:, None]  # one rate per stat -> every line of that stat
+    p0 = np.broadcast_to(prior, out_shape).reshape(-1)
+    alpha = p0 * prior_strength + raw * n_eff
+    beta = (1 - p0) * prior_strength + (1 - raw) * n_eff
+    shrunk = alpha / (alpha + beta)
+
+    z = NormalDist().inv_cdf((1 + ci) / 2)
+    sd = np.sqrt(alpha * beta / ((alpha + beta) ** 2 * (alpha + beta + 1)))
+    bayes_lo = np.clip(shrunk - z * sd, 0.0, 1.0)
+    bayes_hi = np.clip(shrunk + z * sd, 0.0, 1.0)
+
+    return {
+        "raw": raw.reshape(out_shape),
+        "boot_lo": boot_lo.reshape(out_shape),
+        "boot_hi": boot_hi.reshape(out_shape),
+        "shrunk": shrunk.reshape(out_shape),
+        "bayes_lo": bayes_lo.reshape(out_shape),
+        "bayes_hi": bayes_hi.reshape(out_shape),
+    }
@@ -0,0 +1,104 @@
+import time
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .league_logs import fetch_league_logs
+from .storage import current_season, load_frame, save_frame
+
+
+# ---------------------------
+# Config
+# ---------------------------
+CONTEXT_COLS = [
+    "REST_DAYS", "IS_B2B", "GAMES_LAST_4", "GAMES_LAST_7",
+    "IS_HOME", "VENUE_STREAK",
+]
+
+MAX_REST = 7           # season openers / long breaks are capped here
+REFRESH_SECONDS = 3600  # current season is rebuilt at most hourly
+
+
+# ---------------------------
+# Vectorized computation
+# ---------------------------
+def _games_in_window(team_codes: np.ndarray, days: np.ndarray, window: int) -> np.ndarray:
+    """Games a team played in the `window` days ending on each game (inclusive)."""
+    key = team_codes * 100_000 + days          # sorted by team, then date
+    left = np.searchsorted(key, key - (window - 1), side="left")
+    return np.arange(len(key)) - left + 1
+
+
+def compute_schedule_context(team_logs: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per team-game (TEAM_ABBR, GAME_ID) with rest / density / venue
+    context, computed for the whole league in a single sorted pass.
+    """
+    df = team_logs[["TEAM_ABBR", "GAME_ID", "GAME_DATE", "MATCHUP"]].copy()
+    df = df.sort_values(["TEAM_ABBR", "GAME_DATE"]).reset_index(drop=True)
+
+    team_codes = df["TEAM_ABBR"].astype("category").cat.codes.to_numpy(np.int64)
+    days = (df["GAME_DATE"].to_numpy("datetime64[D]").astype(np.int64))
+    new_team = np.r_[True, team_codes[1:] != team_codes[:-1]]
+
+    # Days off between consecutive games (0 = back-to-back)
+    gap = np.r_[0, np.diff(days)] - 1
+    rest = np.where(new_team, MAX_REST, np.clip(gap, 0, MAX_REST))
+    df["REST_DAYS"] = rest
+    df["IS_B2B"] = (rest == 0).astype(int)
+
+    df["GAMES_LAST_4"] = _games_in_window(team_codes, days, 4)
+    df["GAMES_LAST_7"] = _games_in_window(team_codes, days, 7)
+
+    # Home / away streak (length of the current homestand or road trip)
+    is_home = df["MATCHUP"].astype(str).str.contains("vs.", regex=False).to_numpy()
+    df["IS_HOME"] = is_home.astype(int)
+    run_start = new_team | np.r_[True, is_home[1:] != is_home[:-1]]
+    run_id = np.cumsum(run_start)
+    df["VENUE_STREAK"] = df.groupby(run_id).cumcount().to_numpy() + 1
+
+    return df[["TEAM_ABBR", "GAME_ID"] + CONTEXT_COLS]
+
+
+# ---------------------------
+# Cached per-season tables
+# ---------------------------
+def _context_file(season: str) -> str:
+    return f"schedule_{season}.pkl"
+
+
+@lru_cache(maxsize=16)
+def _schedule_context_cached(season: str, bucket: int) -> pd.DataFrame:
+    if season != current_season():
+        cached = load_frame(_context_file(season))
+        if not cached.empty:
+            return cached  # past schedules never change
+
+    team_logs = fetch_league_logs(season, "T")
+    if team_logs.empty:
+        return pd.DataFrame(columns=["TEAM_ABBR", "GAME_ID"] + CONTEXT_COLS)
+
+    ctx = compute_schedule_context(team_logs)
+    save_frame(ctx, _context_file(season))
+    return ctx
+
+
+def schedule_context(season: str) -> pd.DataFrame:
+    """League-wide team-game context for one season (shared by every player)."""
+    bucket = int(time.time() // REFRESH_SECONDS) if season == current_season() else 0
+    return _schedule_context_cached(season, bucket)
+
+
+def add_schedule_context(logs: pd.DataFrame) -> pd.DataFrame:
+    """Join context onto player logs by GAME_ID + TEAM_ABBR."""
+    seasons = logs["SEASON_USED"].unique()
+    ctx = pd.concat([schedule_context(s) for s in seasons], ignore_index=True)
+    if ctx.empty:
+        return logs
+
+    return logs.merge(
+        ctx.rename(columns={"GAME_ID": "Game_ID"}),
+        on=["Game_ID", "TEAM_ABBR"],
+        how="left",
+    )
@@ -0,0 +1,60 @@
+import secrets
+import sqlite3
+import threading
+import time
+
+from .storage import data_path
+
+
+# ---------------------------
+# Config
+# ---------------------------
+DB_FILE = "sessions.sqlite3"
+SESSION_MAX_AGE = 60 * 60 * 24 * 7  # 7 days
+
+
+# ---------------------------
+# Server-side session store (shared by every worker process)
+# ---------------------------
+class SessionStore:
+    """Opaque session ID -> username. The browser only ever holds the ID."""
+
+    def __init__(self, path=None, max_age: int = SESSION_MAX_AGE):
+        self.path = str(path or data_path(DB_FILE))
+        self.max_age = max_age
+        self._local = threading.local()
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "sid TEXT PRIMARY KEY, user TEXT, expires_at REAL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def create(self, user: str) -> str:
+        sid = secrets.token_urlsafe(32)
+        self._conn().execute(
+            "INSERT INTO sessions VALUES (?, ?, ?)",
+            (sid, user, time.time() + self.max_age),
+        )
+        return sid
+
+    def get(self, sid: str):
+        row = self._conn().execute(
+            "SELECT user, expires_at FROM sessions WHERE sid = ?",
+            (sid,),
+        ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def delete(self, sid: str):
+        self._conn().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    def prune(self):
+        self._conn().execute("DELETE FROM sessions WHERE expires_at < ?", (time.time(),))
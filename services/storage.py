@@ -0,0 +1,56 @@
+"""Data directory, frame pickles and season strings, with no nba_api import."""
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+
+# ---------------------------
+# Config
+# ---------------------------
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = PROJECT_ROOT / "data"
+
+
+# ---------------------------
+# Season helpers
+# ---------------------------
+def season_string(end_year: int) -> str:
+    """2026 -> '2025-26' (same format as fetch_player_logs)."""
+    return f"{end_year-1}-{str(end_year)[2:]}"
+
+
+def current_season(today: date = None) -> str:
+    """NBA seasons roll over in October."""
+    today = today or date.today()
+    end_year = today.year + 1 if today.month >= 10 else today.year
+    return season_string(end_year)
+
+
+# ---------------------------
+# Persistent store helpers
+# ---------------------------
+def data_path(name: str) -> Path:
+    DATA_DIR.mkdir(exist_ok=True)
+    return DATA_DIR / name
+
+
+def load_frame(name: str) -> pd.DataFrame:
+    path = data_path(name)
+    if not path.exists():
+        return pd.DataFrame()
+    return pd.read_pickle(path)
+
+
+def save_frame(df: pd.DataFrame, name: str) -> None:
+    path = data_path(name)
+    # Unique temp file per writer, so concurrent saves never share one
+    with tempfile.NamedTemporaryFile(dir=DATA_DIR, prefix=f".{name}.", suffix=".tmp", delete=False) as f:
+        tmp = Path(f.name)
+    try:
+        df.to_pickle(tmp)
+        tmp.replace(path)  # atomic swap so readers never see half a file
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
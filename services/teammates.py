@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from .league_logs import fetch_league_logs
+from .storage import current_season, load_frame, save_frame
+
+
+# ---------------------------
+# Participation (who appeared in which game)
+# ---------------------------
+PARTICIPATION_COLS = ["TEAM_ABBR", "GAME_ID", "GAME_DATE", "PLAYER_ID", "PLAYER_NAME"]
+
+
+def _participation_file(season: str) -> str:
+    return f"participation_{season}.pkl"
+
+
+def load_participation(season: str) -> pd.DataFrame:
+    """
+    TEAM_ABBR / GAME_ID / GAME_DATE / PLAYER_ID / PLAYER_NAME rows for one season.
+    Past seasons never change, so they are read from disk once fetched.
+    """
+    if season != current_season():
+        cached = load_frame(_participation_file(season))
+        if not cached.empty and "GAME_DATE" in cached.columns:
+            return cached
+
+    logs = fetch_league_logs(season, "P")
+    if logs.empty:
+        return pd.DataFrame(columns=PARTICIPATION_COLS)
+
+    part = logs[logs["MIN"] > 0][PARTICIPATION_COLS].copy()
+    part["GAME_ID"] = part["GAME_ID"].astype(np.int64)
+    part["PLAYER_ID"] = part["PLAYER_ID"].astype(np.int64)
+    part = part.reset_index(drop=True)
+
+    save_frame(part, _participation_file(season))
+    return part
+
+
+# ---------------------------
+# Per-team game index
+# ---------------------------
+def build_team_index(seasons) -> dict:
+    """
+    team -> {
+        "games":   sorted int64 array of every GAME_ID the team played,
+        "players": PLAYER_ID -> sorted int64 array of GAME_IDs they appeared in,
+        "tenure":  PLAYER_ID -> sorted int64 array of the team's GAME_IDs from
+                   that player's first to last appearance (by date),
+        "names":   PLAYER_ID -> PLAYER_NAME,
+    }
+    """
+    frames = [load_participation(s) for s in seasons]
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return {}
+
+    part = pd.concat(frames, ignore_index=True)
+    index = {}
+
+    for team, tdf in part.groupby("TEAM_ABBR"):
+        # Team schedule in date order; a player's tenure is a slice of it
+        schedule = (
+            tdf.drop_duplicates("GAME_ID")
+            .sort_values(["GAME_DATE", "GAME_ID"])["GAME_ID"]
+            .to_numpy(np.int64)
+        )
+        position = {gid: i for i, gid in enumerate(schedule)}
+
+        players, tenure = {}, {}
+        for pid, g in tdf.groupby("PLAYER_ID"):
+            played = np.unique(g["GAME_ID"].to_numpy())
+            spots = [position[gid] for gid in played]
+            players[int(pid)] = played
+            tenure[int(pid)] = np.sort(schedule[min(spots):max(spots) + 1])
+
+        index[team] = {
+            "games": np.sort(schedule),
+            "players": players,
+            "tenure": tenure,
+            "names": dict(zip(tdf["PLAYER_ID"].astype(int), tdf["PLAYER_NAME"])),
+        }
+
+    return index
+
+
+def teammate_options(team_entry: dict, exclude_id: int = None) -> dict:
+    """PLAYER_ID -> name, most games played first."""
+    if not team_entry:
+        return {}
+    ranked = sorted(
+        team_entry["players"].items(),
+        key=lambda kv: len(kv[1]),
+        reverse=True,
+    )
+    return {
+        pid: team_entry["names"][pid]
+        for pid, _ in ranked
+        if pid != exclude_id
+    }
+
+
+# ---------------------------
+# Split masks
+# ---------------------------
+def split_mask(game_ids, team_entry: dict, teammate_ids, mode: str = "With") -> np.ndarray:
+    """
+    Boolean mask over game_ids.
+
+    "With":    every chosen teammate appeared.
+    "Without": none of the chosen teammates appeared, counting only games
+               inside each teammate's tenure with the team (first to last
+               appearance), so seasons before they joined or after they
+               left don't count as "without".
+    Games the team did not play (e.g. before a trade) are always excluded.
+    """
+    game_ids = np.asarray(game_ids, dtype=np.int64)
+    mask = np.isin(game_ids, team_entry["games"])
+    empty = np.empty(0, np.int64)
+
+    for tid in teammate_ids:
+        present = np.isin(game_ids, team_entry["players"].get(tid, empty))
+        if mode == "With":
+            mask &= present
+        else:
+            mask &= ~present & np.isin(game_ids, team_entry.get("tenure", {}).get(tid, empty))
+
+    return mask
@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+
+from services.engine import ensure_cols
+
+
+@pytest.fixture
+def make_logs():
+    """Synthetic single-player logs (oldest first in, newest first out)."""
+    def make(pts=range(6), rest_days=None):
+        pts = list(pts)
+        df = pd.DataFrame({
+            "GAME_DATE": pd.date_range("2025-01-01", periods=len(pts)),
+            "MATCHUP": (["DEN vs. LAL", "DEN @ UTA"] * len(pts))[:len(pts)],
+            "PTS": pts, "REB": 1, "AST": 1, "FG3M": 0, "MIN": 30,
+            "SEASON_USED": "2024-25",
+        })
+        if rest_days is not None:
+            df["REST_DAYS"] = rest_days
+            df["IS_HOME"] = ([1, 0] * len(pts))[:len(pts)]
+        return ensure_cols(df)
+
+    return make
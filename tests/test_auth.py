@@ -0,0 +1,32 @@
+import auth
+from auth import check_credentials, hash_password, verify_password
+
+
+def test_verify_password():
+    stored = hash_password("hunter2", iterations=1000)
+    assert verify_password(stored, "hunter2")
+    assert not verify_password(stored, "hunter3")
+
+
+def test_malformed_hashes_are_rejected():
+    good = hash_password("pw", iterations=1000)
+    scheme, iters, salt, digest = good.split("$")
+    for bad in [
+        "",
+        "not-a-hash",
+        f"md5${iters}${salt}${digest}",
+        f"{scheme}$many${salt}${digest}",
+        f"{scheme}${iters}$zz-not-hex${digest}",
+    ]:
+        assert not verify_password(bad, "pw")
+
+
+def test_unknown_user_still_runs_pbkdf2(monkeypatch):
+    users = {"alice": hash_password("pw", iterations=1000)}
+    seen = []
+    real = auth.verify_password
+    monkeypatch.setattr(auth, "verify_password", lambda stored, pw: seen.append(stored) or real(stored, pw))
+
+    assert check_credentials(users, "alice", "pw")
+    assert not check_credentials(users, "mallory", "pw")
+    assert len(seen) == 2 and seen[1].startswith(auth.HASH_SCHEME)
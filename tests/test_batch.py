@@ -0,0 +1,40 @@
+import json
+
+import batch
+
+
+def test_bad_items_and_empty_samples(monkeypatch, make_logs):
+    monkeypatch.setattr(batch, "_load_logs", lambda player: make_logs([10, 20, 30, 40]))
+    results = batch.evaluate_batch([
+        {"player": "A", "stat": "PTS", "line": 24.5},
+        {"stat": "PTS", "line": 24.5},
+        {"player": "A", "stat": "PTS", "line": "abc"},
+        {"player": "A", "stat": "PTS", "line": 24.5, "opponent": "BOS"},
+    ])
+
+    assert results[0]["games"] == 4 and "error" not in results[0]
+    assert "player" in results[1]["error"]
+    assert "line" in results[2]["error"]
+
+    out = json.loads(batch.to_json(results))  # strict JSON: no NaN tokens
+    assert out[3]["games"] == 0 and out[3]["projection"] is None
+
+
+def test_grouped_matches_single_evaluation(monkeypatch, make_logs):
+    from services.engine import evaluate_prop
+
+    monkeypatch.setattr(batch, "_load_logs", lambda player: make_logs([10, 20, 30, 40]))
+    reqs = [
+        {"player": "A", "stat": "PTS", "line": 15.5},
+        {"player": "A", "stat": "PTS", "line": 35.5, "side": "Under"},
+        {"player": "A", "stat": "Pts+Reb", "line": 20.5},
+        {"player": "A", "stat": "BLK", "line": 1.5},
+    ]
+    results = batch.evaluate_batch(reqs)
+
+    logs = make_logs([10, 20, 30, 40])
+    for req, res in zip(reqs[:3], results):
+        single = evaluate_prop(logs, logs, req["stat"], req["line"], req.get("side", "Over"))
+        assert res["hits"] == single["hits"]
+        assert abs(res["prob"] - single["prob"]) < 1e-9
+    assert "unknown stat" in results[3]["error"]
@@ -0,0 +1,26 @@
+import numpy as np
+
+from services.compare import compare_players, stack_logs
+
+
+def test_stack_logs_pads_short_histories(make_logs):
+    arr = stack_logs([make_logs(range(6)), make_logs([9, 9])], ["PTS"], window=4)
+
+    assert arr.shape == (2, 4, 1)
+    assert arr[0, :, 0].tolist() == [5, 4, 3, 2]  # newest first
+    assert arr[1, :2, 0].tolist() == [9, 9]
+    assert np.isnan(arr[1, 2:, 0]).all()
+
+
+def test_compare_players_short_history(make_logs):
+    table = compare_players(
+        {"Full": make_logs(range(6)), "Rookie": make_logs([9, 1])},
+        "PTS", 2.5, "Over", window=4, stats=["PTS", "REB"],
+    ).set_index("Player")
+
+    assert table.loc["Full", "Games"] == 4
+    assert table.loc["Full", "Hit % (Over 2.5)"] == 75.0  # 5, 4, 3 of 5, 4, 3, 2
+    # Rates over the games actually played, not the window
+    assert table.loc["Rookie", "Games"] == 2
+    assert table.loc["Rookie", "Hit % (Over 2.5)"] == 50.0
+    assert table.loc["Rookie", "PTS"] == 5.0
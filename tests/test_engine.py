@@ -0,0 +1,32 @@
+import pytest
+
+from services.engine import apply_filters
+
+
+def test_rest_filter_without_context_raises(make_logs):
+    with pytest.raises(ValueError):
+        apply_filters(make_logs(), rest="Back-to-back")
+    with pytest.raises(ValueError):
+        apply_filters(make_logs(), venue="Home")
+    assert len(apply_filters(make_logs())) == 6
+
+
+def test_rest_and_venue_filters(make_logs):
+    logs = make_logs(rest_days=[7, 0, 1, 0, 2, 3])
+    assert len(apply_filters(logs, rest="Back-to-back")) == 2
+    assert len(apply_filters(logs, rest="2+ days")) == 3
+    assert len(apply_filters(logs, venue="Away")) == 3
+
+
+def test_prior_comes_from_games_outside_the_sample(make_logs):
+    from services.engine import evaluate_prop
+
+    logs = make_logs(rest_days=[7, 0, 1, 0, 2, 3])  # PTS 5, 4, ... 0 newest first
+    # Last 2 games both hit; the 4 left-out games all miss
+    recent = apply_filters(logs, recent="Last 5").head(2)
+    ev = evaluate_prop(recent, logs, "PTS", 3.5)
+    assert ev["hit_rate"] == 100
+    assert ev["prob"] < 50  # pulled toward the 0% outside rate, not the 33% career rate
+
+    everything = evaluate_prop(logs, logs, "PTS", 3.5)
+    assert abs(everything["prob"] - (5 + 2) / (10 + 6) * 100) < 1e-9  # 0.5 prior
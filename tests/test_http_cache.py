@@ -0,0 +1,67 @@
+import requests
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from services import http_cache
+
+
+def _fake_upstream(monkeypatch, calls):
+    def fake_get(self, url, params=None, **kwargs):
+        calls.append((url, params))
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = url
+        resp._content = b'{"resultSets": []}'
+        return resp
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+
+def test_list_of_pairs_params(monkeypatch, tmp_path):
+    calls = []
+    _fake_upstream(monkeypatch, calls)
+    session = http_cache.CachingSession(http_cache.ResponseStore(tmp_path / "c.db"))
+
+    params = [("PlayerID", 1), ("Season", "2019-20")]
+    for _ in range(2):
+        resp = session.get("https://stats.nba.com/stats/playergamelog", params=params)
+        assert resp.json() == {"resultSets": []}
+
+    assert len(calls) == 1
+    assert http_cache.ttl_for("https://stats.nba.com/stats/playergamelog", params) == http_cache.IMMUTABLE_TTL
+    assert http_cache.cache_key("u", params) == http_cache.cache_key("u", dict(params))
+
+
+def test_nba_api_call_shape(monkeypatch, tmp_path):
+    calls = []
+    _fake_upstream(monkeypatch, calls)
+    session = http_cache.CachingSession(http_cache.ResponseStore(tmp_path / "c.db"))
+    monkeypatch.setattr(NBAStatsHTTP, "_session", session)
+
+    for _ in range(2):
+        NBAStatsHTTP().send_api_request(
+            endpoint="playergamelog",
+            parameters={"Season": "2019-20", "PlayerID": 1},
+        )
+
+    assert len(calls) == 1
+    assert isinstance(calls[0][1], list)  # nba_api really sends pairs
+
+
+def test_stats_requests_are_throttled_per_host():
+    assert http_cache.throttle_for("https://stats.nba.com/stats/playergamelog") is not None
+    assert http_cache.throttle_for("https://cdn.nba.com/static/json/liveData/x.json") is None
+
+
+def test_lease_release_is_per_thread(tmp_path):
+    import threading
+
+    store = http_cache.ResponseStore(tmp_path / "c.db")
+    assert store.acquire("k")
+
+    other = threading.Thread(target=store.release, args=("k",))
+    other.start()
+    other.join()
+
+    assert not store.acquire("k")  # still held by this thread
+    store.release("k")
+    assert store.acquire("k")
@@ -0,0 +1,47 @@
+from services import lineups
+from services.lineups import add_deltas, boxscore_signature, process_players
+
+
+def _player(name, pts, oncourt="1"):
+    return {
+        "personId": ord(name), "name": name, "oncourt": oncourt,
+        "statistics": {"minutes": "PT10M00.00S", "points": pts, "reboundsTotal": 1,
+                       "assists": 0, "threePointersMade": 0, "plusMinusPoints": 0},
+    }
+
+
+def test_boxscore_signature_tracks_displayed_fields_only():
+    a = [_player("A", 10)]
+    b = [_player("A", 10)]
+    b[0]["statistics"]["fieldGoalsPercentage"] = 0.5  # not shown, not signed
+    assert boxscore_signature(a) == boxscore_signature(b)
+
+    b[0]["statistics"]["points"] = 12
+    assert boxscore_signature(a) != boxscore_signature(b)
+    b[0]["statistics"]["points"] = 10
+    b[0]["oncourt"] = "0"
+    assert boxscore_signature(a) != boxscore_signature(b)
+
+
+def test_add_deltas():
+    prev = process_players([_player("A", 10), _player("B", 4)])
+    cur = process_players([_player("A", 13), _player("B", 4, oncourt="0")])
+    out = add_deltas(cur, prev).set_index("Player")["Δ"]
+    assert out["A"] == "+3 PTS"
+    assert out["B"] == "↔"
+    assert (add_deltas(cur, None)["Δ"] == "").all()
+
+
+def test_delta_cleared_on_unchanged_tick(monkeypatch):
+    snap = {}
+    feed = {"away": [_player("A", 10)]}
+    monkeypatch.setattr(lineups, "get_snapshot", lambda game_id: snap)
+    monkeypatch.setattr(lineups, "get_boxscore_raw", lambda game_id: (feed["away"], []))
+
+    lineups.get_boxscore_delta("g")
+    feed["away"] = [_player("A", 12)]
+    a_df, _, changed = lineups.get_boxscore_delta("g")
+    assert changed and a_df["Δ"].iloc[0] == "+2 PTS"
+
+    a_df, _, changed = lineups.get_boxscore_delta("g")
+    assert not changed and a_df["Δ"].iloc[0] == ""
@@ -0,0 +1,71 @@
+from services import live_tracker
+from services.live_tracker import LivePropTracker
+
+
+def _feed(monkeypatch, actions):
+    class FakePlayByPlay:
+        def __init__(self, game_id):
+            pass
+
+        def get_dict(self):
+            return {"game": {"actions": [dict(a) for a in actions]}}
+
+    monkeypatch.setattr(live_tracker.playbyplay, "PlayByPlay", FakePlayByPlay)
+    monkeypatch.setattr(live_tracker, "MIN_UPDATE_SECONDS", 0.0)
+
+
+def _shot(n, pid, kind="2pt", edited="2026-01-01T00:00:00Z"):
+    return {"actionNumber": n, "actionType": kind, "shotResult": "Made",
+            "personId": pid, "period": 1, "clock": "PT11M00.00S", "edited": edited}
+
+
+def test_in_place_edit_and_deletion_rebuild(monkeypatch):
+    actions = [_shot(1, 7), _shot(2, 7)]
+    _feed(monkeypatch, actions)
+    tracker = LivePropTracker("g")
+
+    assert tracker.update() == 2
+    assert tracker.value(7, "PTS") == 4
+
+    # Shot re-scored as a three (same actionNumber, new edited stamp)
+    actions[1] = _shot(2, 7, "3pt", edited="2026-01-01T00:01:00Z")
+    tracker.update()
+    assert tracker.value(7, "PTS") == 5
+
+    # First shot removed, new action appended
+    del actions[0]
+    actions.append(_shot(3, 9))
+    tracker.update()
+    assert tracker.value(7, "PTS") == 3
+    assert tracker.value(9, "PTS") == 2
+
+
+def test_late_insert_is_folded_once(monkeypatch):
+    actions = [_shot(n, 7) for n in (1, 2, 3, 4)]
+    _feed(monkeypatch, actions)
+    tracker = LivePropTracker("g")
+    assert tracker.update() == 4
+
+    # Late-entered play lands mid-list (feed is in orderNumber order)
+    actions.insert(2, _shot(5, 9))
+    assert tracker.update() == 1
+    assert tracker.update() == 0
+    assert tracker.last_action == 5
+    assert tracker.value(7, "PTS") == 8
+    assert tracker.value(9, "PTS") == 2
+
+
+def test_fetch_runs_outside_the_lock(monkeypatch):
+    tracker = LivePropTracker("g")
+
+    class CheckingPlayByPlay:
+        def __init__(self, game_id):
+            assert not tracker._lock.locked()
+
+        def get_dict(self):
+            return {"game": {"actions": [_shot(1, 7)]}}
+
+    monkeypatch.setattr(live_tracker.playbyplay, "PlayByPlay", CheckingPlayByPlay)
+    monkeypatch.setattr(live_tracker, "MIN_UPDATE_SECONDS", 0.0)
+    assert tracker.update() == 1
+    assert tracker.progress(7, "PTS", 1.5)["hit"]
@@ -0,0 +1,56 @@
+import pandas as pd
+
+from services import matchups, storage
+from services.matchups import _aggregate_last_n, update_matchup_tables
+
+
+def _league_logs(games):
+    """Two player rows per game against DEN: guard 1 and big 2."""
+    rows = []
+    for g in games:
+        for pid, pts in ((1, 10 + g), (2, 5)):
+            rows.append({
+                "PLAYER_ID": pid, "OPP_ABBR": "DEN", "GAME_ID": g,
+                "GAME_DATE": pd.Timestamp("2025-01-01") + pd.Timedelta(days=g),
+                "PTS": pts, "REB": 1, "AST": 1, "FG3M": 0,
+            })
+    return pd.DataFrame(rows)
+
+
+def test_aggregate_last_n_uses_most_recent_games():
+    facts = _league_logs([1, 2, 3]).assign(POSITION="G")
+    table = _aggregate_last_n(facts[facts["PLAYER_ID"] == 1], last_n=2).iloc[0]
+    assert table["GAMES"] == 2
+    assert table["PTS"] == (12 + 13) / 2
+
+
+def test_incremental_update_parks_unknown_positions(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path)
+    games = [1, 2]
+    index = {"rows": [(1, "G")]}  # player 2 not in PlayerIndex yet
+    calls = []
+
+    def fake_positions(season):
+        calls.append(season)
+        return pd.DataFrame(index["rows"], columns=["PLAYER_ID", "POSITION"])
+
+    monkeypatch.setattr(matchups, "fetch_league_logs", lambda season, kind: _league_logs(games))
+    monkeypatch.setattr(matchups, "fetch_player_positions", fake_positions)
+
+    table = update_matchup_tables("2024-25", last_n=10)
+    assert set(table["POSITION"]) == {"G"}
+    assert len(calls) == 1
+
+    # New game, but the miss is remembered: no PlayerIndex refetch
+    games.append(3)
+    table = update_matchup_tables("2024-25", last_n=10)
+    assert len(calls) == 1
+    assert table.set_index("POSITION").loc["G", "GAMES"] == 3
+
+    # Once the miss expires and the index lists player 2, parked rows are ingested
+    index["rows"].append((2, "C"))
+    monkeypatch.setattr(matchups, "POSITION_MISS_TTL", -1)
+    table = update_matchup_tables("2024-25", last_n=10).set_index("POSITION")
+    assert len(calls) == 2
+    assert table.loc["C", "GAMES"] == 3
+    assert table.loc["C", "PTS"] == 5
@@ -0,0 +1,60 @@
+import pandas as pd
+
+from services import odds_provider, prewarm
+
+
+def _game(tip, away, home):
+    return {
+        "gameTimeUTC": tip,
+        "awayTeam": {"teamTricode": away, "teamId": away},
+        "homeTeam": {"teamTricode": home, "teamId": home},
+    }
+
+
+ROSTERS = {
+    # 900000x: IDs not in the static index, so their roster names are kept
+    "DEN": [(203999, "Nikola Jokic"), (9000001, "Bench Guy"), (9000002, "Starter Guy")],
+    "LAL": [(9000003, "Laker")],
+    "BOS": [(9000004, "Celtic")],
+    "NYK": [(9000005, "Knick")],
+}
+
+
+class FakeRoster:
+    def __init__(self, team_id, season):
+        self.rows = ROSTERS[team_id]
+
+    def get_data_frames(self):
+        return [pd.DataFrame(self.rows, columns=["PLAYER_ID", "PLAYER"])]
+
+
+def test_slate_queue_order_and_names(monkeypatch):
+    monkeypatch.setattr(prewarm, "todays_games", lambda: [
+        _game("2026-01-01T00:00Z", "DEN", "LAL"),
+        _game("2026-01-01T02:30Z", "BOS", "NYK"),
+    ])
+    minutes = pd.DataFrame({"PLAYER_ID": [203999, 9000001, 9000002, 9000003, 9000004, 9000005], "MIN": [35, 5, 30, 20, 20, 20]})
+    monkeypatch.setattr(prewarm, "fetch_league_logs", lambda season, kind: minutes)
+    monkeypatch.setattr(prewarm.commonteamroster, "CommonTeamRoster", FakeRoster)
+
+    queue = prewarm.build_slate_queue("2025-26")
+    names = [name for _, _, name in queue]
+
+    # Earliest game first; rotation by MPG, bench (<10 MPG) skipped;
+    # roster spelling resolved to the static full_name the app uses
+    assert names == ["Nikola Jokić", "Starter Guy", "Laker", "Celtic", "Knick"]
+    assert queue[0][1] == "DEN @ LAL"
+
+
+def test_odds_failure_reaches_admin_status(monkeypatch):
+    def broken():
+        raise RuntimeError("quota exceeded")
+
+    monkeypatch.setattr(odds_provider, "load_au_odds", broken)
+    monkeypatch.setattr(prewarm, "build_slate_queue", lambda: [])
+    monkeypatch.setattr(prewarm, "update_matchup_tables", lambda: None)
+
+    prewarm.run_slate()
+    status = prewarm.prewarm_status()
+    assert status["last_error"] == "odds: quota exceeded"
+    assert status["state"] == "done"
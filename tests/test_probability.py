@@ -0,0 +1,20 @@
+import numpy as np
+
+from services.probability import hit_probability
+
+
+def test_per_stat_prior_broadcasts_over_lines():
+    values = np.zeros((4, 2))  # two stats, always 0
+    lines = [[0.5, 1.5, 2.5], [0.5, 1.5, 2.5]]
+    out = hit_probability(values, lines, "Over", n_boot=10, prior_rate=[0.9, 0.1])
+
+    assert out["shrunk"].shape == (2, 3)
+    # Each stat's lines share that stat's prior, so rows differ, columns don't
+    assert np.allclose(out["shrunk"][0], out["shrunk"][0, 0])
+    assert np.allclose(out["shrunk"][1], out["shrunk"][1, 0])
+    assert out["shrunk"][0, 0] > out["shrunk"][1, 0]
+
+
+def test_scalar_prior_for_single_stat():
+    out = hit_probability([10, 20, 30], [15.5, 25.5], "Over", n_boot=10, prior_rate=0.5)
+    assert out["shrunk"].shape == (2,)
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from services.schedule_context import MAX_REST, compute_schedule_context
+
+
+def _team_logs():
+    # (team, day in Jan 2025, home?)
+    games = [
+        ("AAA", 1, True), ("AAA", 2, True), ("AAA", 4, False), ("AAA", 5, False), ("AAA", 10, True),
+        ("BBB", 1, True), ("BBB", 3, True),
+    ]
+    return pd.DataFrame({
+        "TEAM_ABBR": [t for t, _, _ in games],
+        "GAME_ID": range(len(games)),
+        "GAME_DATE": [pd.Timestamp(2025, 1, d) for _, d, _ in games],
+        "MATCHUP": [f"{t} vs. CCC" if home else f"{t} @ CCC" for t, _, home in games],
+    }).sample(frac=1, random_state=0)  # input order must not matter
+
+
+def test_rest_density_and_venue():
+    ctx = compute_schedule_context(_team_logs())
+    a = ctx[ctx["TEAM_ABBR"] == "AAA"]
+
+    assert a["REST_DAYS"].tolist() == [MAX_REST, 0, 1, 0, 4]
+    assert a["IS_B2B"].tolist() == [0, 1, 0, 1, 0]
+    assert a["GAMES_LAST_4"].tolist() == [1, 2, 3, 3, 1]
+    assert a["GAMES_LAST_7"].tolist() == [1, 2, 3, 4, 3]
+    assert a["IS_HOME"].tolist() == [1, 1, 0, 0, 1]
+    assert a["VENUE_STREAK"].tolist() == [1, 2, 1, 2, 1]
+
+
+def test_team_boundaries_reset_windows_and_streaks():
+    ctx = compute_schedule_context(_team_logs())
+    b = ctx[ctx["TEAM_ABBR"] == "BBB"]
+
+    # AAA's games on the same days must not leak into BBB's counts
+    assert b["REST_DAYS"].tolist() == [MAX_REST, 1]
+    assert b["GAMES_LAST_4"].tolist() == [1, 2]
+    # AAA ended on a home game; BBB's homestand still starts at 1
+    assert b["VENUE_STREAK"].tolist() == [1, 2]
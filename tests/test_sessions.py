@@ -0,0 +1,26 @@
+import time
+
+from services.sessions import SessionStore
+
+
+def test_create_get_delete(tmp_path):
+    store = SessionStore(tmp_path / "s.db")
+    sid = store.create("alice")
+
+    assert store.get(sid) == "alice"
+    assert store.get("made-up") is None
+
+    store.delete(sid)
+    assert store.get(sid) is None
+
+
+def test_expired_sessions(tmp_path, monkeypatch):
+    store = SessionStore(tmp_path / "s.db", max_age=60)
+    sid = store.create("alice")
+
+    later = time.time() + 61
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert store.get(sid) is None
+
+    store.prune()
+    assert store._conn().execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 0
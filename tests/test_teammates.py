@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from services import teammates
+from services.teammates import build_team_index, split_mask, teammate_options
+
+
+def _participation(season):
+    # DEN games 1-6 (two seasons); star (1) plays all, newcomer (2) joins in game 4
+    # and sits game 5
+    rows = [(g, 1) for g in range(1, 7)] + [(4, 2), (6, 2)]
+    return pd.DataFrame({
+        "TEAM_ABBR": "DEN",
+        "GAME_ID": [g for g, _ in rows],
+        "GAME_DATE": [pd.Timestamp("2024-01-01") + pd.Timedelta(days=g) for g, _ in rows],
+        "PLAYER_ID": [p for _, p in rows],
+        "PLAYER_NAME": ["Star" if p == 1 else "Newcomer" for _, p in rows],
+    })
+
+
+def test_build_team_index(monkeypatch):
+    monkeypatch.setattr(teammates, "load_participation", _participation)
+    entry = build_team_index(["2024-25"])["DEN"]
+
+    assert entry["games"].tolist() == [1, 2, 3, 4, 5, 6]
+    assert entry["players"][2].tolist() == [4, 6]
+    assert entry["tenure"][2].tolist() == [4, 5, 6]
+    assert list(teammate_options(entry, exclude_id=None)) == [1, 2]  # most games first
+
+
+def test_split_mask_with_and_without(monkeypatch):
+    monkeypatch.setattr(teammates, "load_participation", _participation)
+    entry = build_team_index(["2024-25"])["DEN"]
+    games = np.array([1, 2, 3, 4, 5, 6, 99])  # 99: played for another team
+
+    assert games[split_mask(games, entry, [2], "With")].tolist() == [4, 6]
+    # Only game 5 is "without": games 1-3 predate the newcomer's tenure
+    assert games[split_mask(games, entry, [2], "Without")].tolist() == [5]